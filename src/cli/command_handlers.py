@@ -9,7 +9,6 @@ import sys
 
 from decorators.input_error import input_error
 from services.contacts_manager import (
-    show_all,
     add_contact,
     change_contact,
     show_phone,
@@ -24,10 +23,13 @@ from utils.constants import (
     MENU_HELP_STR,
     INVALID_COMMAND_MESSAGE,
     MSG_HELP_AWARE_TIP,
+    MSG_NO_CONTACTS,
 )
-from utils.text_utils import format_contacts_output, format_text_output
+from utils.text_utils import format_text_output
 from validators.args_validators import ensure_args_have_n_arguments
 
+# Greeting message, built once
+_MSG_GREETING = f"{MSG_HELLO_MESSAGE}\n{MSG_APP_PURPOSE_MESSAGE}."
 
 # TODO: Optional future enhancement: add handling (delete_contact, remove_phone) functions
 
@@ -35,7 +37,7 @@ from validators.args_validators import ensure_args_have_n_arguments
 def handle_hello() -> str:
     """Returns a greeting message to the user."""
     # No validation checks here
-    return f"{MSG_HELLO_MESSAGE}\n{MSG_APP_PURPOSE_MESSAGE}."
+    return _MSG_GREETING
 
 
 @input_error
@@ -65,12 +67,12 @@ def handle_all(book: dict) -> str:
     """
     # No validation checks here
 
-    result = show_all(book)
+    # Emptiness is checked directly, without serializing the book
+    if not book:
+        return format_text_output({"message": MSG_NO_CONTACTS})
 
-    if result.get("message"):
-        return format_text_output(result)
-
-    return format_contacts_output(result)
+    # The address book keeps its formatted listing cached until it changes
+    return str(book)
 
 
 @input_error
@@ -161,7 +163,11 @@ def handle_help() -> str:
 def handle_exit(prefix="", suffix=""):
     """Print a farewell message and terminate the program."""
     # No validation here
-    print(f"{prefix}{MSG_EXIT_MESSAGE}{f' {suffix}' if suffix else ''}")
+    if not prefix and not suffix:
+        # Regular exit message, without composing it
+        print(MSG_EXIT_MESSAGE)
+    else:
+        print(f"{prefix}{MSG_EXIT_MESSAGE}{f' {suffix}' if suffix else ''}")
     sys.exit(0)
 
 
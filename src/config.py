@@ -10,9 +10,17 @@ Attributes:
 """
 
 import os
-from dotenv import load_dotenv
 
-# Load environment variables from .env file if present
-load_dotenv()
+_TRUTHY_VALUES = frozenset(("true", "1", "yes"))
 
-DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "yes")
+# Load environment variables from .env file if present,
+# unless the variable is already set by the environment
+if "DEBUG" not in os.environ:
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        pass
+    else:
+        load_dotenv()
+
+DEBUG = os.getenv("DEBUG", "False").lower() in _TRUTHY_VALUES
@@ -2,7 +2,7 @@
 Decorator to log usage of deprecated or transitional functions.
 
 Intended for marking temporary functions that are planned for removal or refactoring.
-Emits a debug log message each time the function is called.
+Emits a debug log message the first time the function is called.
 """
 import functools
 import logging
@@ -15,20 +15,26 @@ def transition_warning(
 ):
     """
     Decorator to mark functions as deprecated during transition.
-    Emits a DeprecationWarning (once per call site) and logs a debug message.
+    Logs a debug message once per decorated function, on its first call,
+    so later calls skip the logging machinery.
 
     Args:
         reason (str): Custom deprecation message.
     """
 
     def decorator(func):
+        emitted = False
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logging.debug(
-                DEFAULT_TRANSITION_REASON,
-                func.__name__,
-                reason,
-            )
+            nonlocal emitted
+            if not emitted:
+                emitted = True
+                logging.debug(
+                    DEFAULT_TRANSITION_REASON,
+                    func.__name__,
+                    reason,
+                )
             return func(*args, **kwargs)
 
         return wrapper
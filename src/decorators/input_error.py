@@ -1,6 +1,8 @@
 """
 Provides a decorator for handling common input-related errors in command handlers.
 """
+from functools import wraps
+
 from utils.constants import (
     ERR_KEY_ERROR,
     ERR_INDEX_ERROR,
@@ -8,6 +10,27 @@ from utils.constants import (
 )
 from validators.errors import ValidationError
 
+# Handled exception types and their user-friendly messages,
+# None stands for the message of the exception itself
+_ERROR_MESSAGES = {
+    ValidationError: None,
+    KeyError: ERR_KEY_ERROR,
+    IndexError: ERR_INDEX_ERROR,
+    ValueError: ERR_VALUE_ERROR,
+    TypeError: None,
+}
+_HANDLED_ERRORS = tuple(_ERROR_MESSAGES)
+
+
+def _get_error_message(exc: Exception) -> str:
+    # Closest handled base class defines the message, e.g.
+    # ValidationError is reported with its own message, not as a ValueError
+    for exc_type in type(exc).__mro__:
+        if exc_type in _ERROR_MESSAGES:
+            message = _ERROR_MESSAGES[exc_type]
+            return str(exc) if message is None else message
+    return str(exc)
+
 
 def input_error(func):
     """
@@ -25,18 +48,11 @@ def input_error(func):
              if no exception is raised.
     """
 
+    @wraps(func)
     def inner(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except ValidationError as exc:
-            return str(exc)
-        except KeyError:
-            return ERR_KEY_ERROR
-        except IndexError:
-            return ERR_INDEX_ERROR
-        except ValueError:
-            return ERR_VALUE_ERROR
-        except TypeError as exc:
-            return str(exc)
+        except _HANDLED_ERRORS as exc:
+            return _get_error_message(exc)
 
     return inner
@@ -58,6 +58,8 @@ def main():
     """
 
     book = AddressBook()
+    # Command results are written directly, the prompt input flushes them
+    write = sys.stdout.write
 
     # Display initial greeting and help text
     print_greeting(MENU_HELP_STR)
@@ -66,7 +68,7 @@ def main():
         # Read user input
         user_input = get_user_input()
         if not user_input:
-            print(f"{MSG_INVALID_EMPTY_COMMAND}.")
+            write(f"{MSG_INVALID_EMPTY_COMMAND}.\n")
             continue
 
         # Get command and arguments from input string
@@ -75,28 +77,188 @@ def main():
         # Match input command with one from the menu
         match command:
             case "hello":
-                print(handle_hello())
+                write(handle_hello() + "\n")
             case "all":
-                print(handle_all(book))
+                write(handle_all(book) + "\n")
             case "add":
-                print(handle_add(args, book))
+                write(handle_add(args, book) + "\n")
             case "change":
-                print(handle_change(args, book))
+                write(handle_change(args, book) + "\n")
             case "phone":
-                print(handle_phone(args, book))
+                write(handle_phone(args, book) + "\n")
             case "add-birthday":
-                print(handle_add_birthday(args, book))
+                write(handle_add_birthday(args, book) + "\n")
             case "show-birthday":
-                print(handle_show_birthday(args, book))
+                write(handle_show_birthday(args, book) + "\n")
             case "birthdays":
-                print(handle_birthdays(book))
+                write(handle_birthdays(book) + "\n")
             case "help":
-                print(handle_help())
+                write(handle_help() + "\n")
             case "exit" | "close":
                 # Terminates the application
                 handle_exit()
             case _:
-                print(handle_unknown())
+                write(handle_unknown() + "\n")
+
+
+# Data-driven menu configuration of the alternative mode
+MENU = {
+    "hello": {
+        # Help for the menu item structure:
+        # A string showing expected arguments help text
+        # in <command> (required argument)
+        # or [command] (optional argument) format
+        # or empty if none are required.
+        "args_str": "",
+        # A string describing what this command does
+        "description": "Greet the user",
+        # The function that handles this command
+        "handler": lambda _, __: handle_hello(),
+        "visible": True,
+    },
+    "all": {
+        "args_str": "",
+        "description": "Display all contacts",
+        "handler": lambda _, book: handle_all(book),
+        "visible": True,
+    },
+    "add": {
+        "args_str": "<name> <phone>",
+        "description": "Add a new contact or add phone to the existing one",
+        "handler": handle_add,
+        "visible": True,
+    },
+    "change": {
+        "args_str": "<name> <old_phone> <new_phone>",
+        "description": "Update contact's phone number",
+        "handler": handle_change,
+        "visible": True,
+    },
+    "phone": {
+        "args_str": "<name>",
+        "description": "Show contact's phone number",
+        "handler": handle_phone,
+        "visible": True,
+    },
+    "add-birthday": {
+        "args_str": "<name> <birthday_date>",
+        "description": "Add a birthday to the specified contact",
+        "handler": handle_add_birthday,
+        "visible": True,
+    },
+    "show-birthday": {
+        "args_str": "<name>",
+        "description": "Show the birthday of the specified contact",
+        "handler": handle_show_birthday,
+        "visible": True,
+    },
+    "birthdays": {
+        "args_str": "",
+        "description": "Show upcoming birthdays within the upcoming week",
+        "handler": lambda _, book: handle_birthdays(book),
+        "visible": True,
+    },
+    "help": {
+        "args_str": "",
+        "description": "Show available commands (this menu)",
+        "handler": lambda _, __: HELP_TEXT,
+        "visible": True,
+    },
+    "exit": {
+        # Aliases as possible alternative commands,
+        # e.g., 'exit' can also be triggered by 'close'
+        "aliases": ["close"],
+        "args_str": "",
+        "description": "Exit the app",
+        "handler": lambda _, __: handle_exit(),
+        "visible": True,
+    },
+}
+
+
+def generate_help_text(menu: dict[str, dict]) -> str:
+    """
+    Generate formatted help text from available commands.
+
+    Args:
+        menu (dict): Menu configuration with commands and their metadata.
+
+    Returns:
+        str: Aligned list of commands with their descriptions.
+    """
+    help_entries = []
+    # Longest command string, to align the output
+    max_command_length = 0
+
+    # Prepare all command strings with their details
+    for command, metadata in menu.items():
+        # Skip commands that are hidden from help (visible=False by design)
+        if not metadata.get("visible", True):
+            continue
+
+        # Format aliases: "exit (or close)"
+        aliases = metadata.get("aliases", [])
+        alias_str = f" (or {', '.join(aliases)})" if aliases else ""
+
+        # Build the command string with arguments
+        command_str = f"{command}{alias_str} {metadata['args_str']}".strip()
+
+        # Append command string and description to the help list
+        help_entries.append((command_str, metadata["description"]))
+        max_command_length = max(max_command_length, len(command_str))
+
+    # Sort the help entries alphabetically
+    # Turned off for now
+    # help_entries.sort(key=lambda x: x[0])
+
+    # Format help lines with aligned commands and descriptions
+    formatted_help_lines = [
+        f"{cmd_str.ljust(max_command_length)} - {description}"
+        for cmd_str, description in help_entries
+    ]
+
+    return "\n".join(formatted_help_lines)
+
+
+def get_commands_by_alias(menu: dict[str, dict]) -> dict[str, str]:
+    """
+    Map lowercase commands of the menu and their aliases to canonical commands.
+
+    Commands take precedence over aliases, earlier menu entries over later ones.
+
+    Args:
+        menu (dict): Menu configuration with commands and their metadata.
+
+    Returns:
+        dict[str, str]: Canonical command by its lowercase name or alias.
+    """
+    commands_by_alias = {command.lower(): command for command in menu}
+    for command, metadata in menu.items():
+        for alias in metadata.get("aliases", []):
+            commands_by_alias.setdefault(alias.lower(), command)
+    return commands_by_alias
+
+
+# Menu derived data, computed once at import
+HELP_TEXT = generate_help_text(MENU)
+COMMANDS_BY_ALIAS = get_commands_by_alias(MENU)
+
+
+def resolve_command(cmd: str) -> str:
+    """
+    Resolves a user input command to its canonical form.
+
+    Looks up the input command among registered commands of the menu
+    and their known aliases.
+
+    Args:
+        cmd (str): The command input string entered by the user.
+
+    Returns:
+        str: The matched canonical command string, or an empty string if not recognized.
+    """
+    # Fallback to empty string if command not found
+    return COMMANDS_BY_ALIAS.get(cmd.lower(), "")
 
 
 @keyboard_interrupt_error(handle_exit)
@@ -108,159 +270,17 @@ def main_alternative():
     for an Assistant bot CLI application.
     """
     book = AddressBook()
-
-    menu = {
-        "hello": {
-            # Help for the menu item structure:
-            # A string showing expected arguments help text
-            # in <command> (required argument)
-            # or [command] (optional argument) format
-            # or empty if none are required.
-            "args_str": "",
-            # A string describing what this command does
-            "description": "Greet the user",
-            # The function that handles this command
-            "handler": lambda _, __: handle_hello(),
-            "visible": True,
-        },
-        "all": {
-            "args_str": "",
-            "description": "Display all contacts",
-            "handler": lambda _, book: handle_all(book),
-            "visible": True,
-        },
-        "add": {
-            "args_str": "<name> <phone>",
-            "description": "Add a new contact or add phone to the existing one",
-            "handler": handle_add,
-            "visible": True,
-        },
-        "change": {
-            "args_str": "<name> <old_phone> <new_phone>",
-            "description": "Update contact's phone number",
-            "handler": handle_change,
-            "visible": True,
-        },
-        "phone": {
-            "args_str": "<name>",
-            "description": "Show contact's phone number",
-            "handler": handle_phone,
-            "visible": True,
-        },
-        "add-birthday": {
-            "args_str": "<name> <birthday_date>",
-            "description": "Add a birthday to the specified contact",
-            "handler": handle_add_birthday,
-            "visible": True,
-        },
-        "show-birthday": {
-            "args_str": "<name>",
-            "description": "Show the birthday of the specified contact",
-            "handler": handle_show_birthday,
-            "visible": True,
-        },
-        "birthdays": {
-            "args_str": "",
-            "description": "Show upcoming birthdays within the upcoming week",
-            "handler": lambda _, book: handle_birthdays(book),
-            "visible": True,
-        },
-        "help": {
-            "args_str": "",
-            "description": "Show available commands (this menu)",
-            "handler": lambda _, __: help_text,
-            "visible": True,
-        },
-        "exit": {
-            # Aliases as possible alternative commands,
-            # e.g., 'exit' can also be triggered by 'close'
-            "aliases": ["close"],
-            "args_str": "",
-            "description": "Exit the app",
-            "handler": lambda _, __: handle_exit(),
-            "visible": True,
-        },
-    }
-
-    def generate_help_text():
-        """
-        Generate formatted help text from available commands.
-
-        Returns:
-            str: Aligned list of commands with their descriptions.
-        """
-        help_entries = []
-
-        # Prepare all command strings with their details
-        for command, metadata in menu.items():
-            # Skip commands that are hidden from help (visible=False by design)
-            if not metadata.get("visible", True):
-                continue
-
-            # Format aliases: "exit (or close)"
-            aliases = metadata.get("aliases", [])
-            alias_str = f" (or {', '.join(aliases)})" if aliases else ""
-
-            # Build the command string with arguments
-            command_str = f"{command}{alias_str} {metadata['args_str']}".strip()
-
-            # Append command string and description to the help list
-            help_entries.append((command_str, metadata["description"]))
-
-        # Sort the help entries alphabetically
-        # Turned off for now
-        # help_entries.sort(key=lambda x: x[0])
-
-        # Find the longest command string to align the output
-        max_command_length = 0
-        if help_entries:
-            max_command_length = max(len(cmd_str) for cmd_str, _ in help_entries)
-
-        # Format help lines with aligned commands and descriptions
-        formatted_help_lines = [
-            f"{cmd_str.ljust(max_command_length)} - {description}"
-            for cmd_str, description in help_entries
-        ]
-
-        return "\n".join(formatted_help_lines)
-
-    def resolve_command(cmd: str) -> str:
-        """
-        Resolves a user input command to its canonical form.
-
-        Checks if the input command matches a registered command in the menu.
-        If not found, attempts to resolve it via known aliases.
-
-        Args:
-            cmd (str): The command input string entered by the user.
-
-        Returns:
-            str: The matched canonical command string, or an empty string if not recognized.
-        """
-        cmd = cmd.lower()
-        for item in menu:
-            if cmd == item.lower():
-                return item
-
-        # Resolve aliases
-        for key, meta in menu.items():
-            aliases = [alias.lower() for alias in meta.get("aliases", [])]
-            if cmd in aliases:
-                return key
-
-        # Fallback if command not found
-        return ""
-
-    help_text = generate_help_text()
+    # Command results are written directly, the prompt input flushes them
+    write = sys.stdout.write
 
     # Display initial greeting and help text
-    print_greeting(help_text)
+    print_greeting(HELP_TEXT)
 
     while True:
         # Read user input
         user_input = get_user_input()
         if not user_input:
-            print(f"{MSG_INVALID_EMPTY_COMMAND}.")
+            write(f"{MSG_INVALID_EMPTY_COMMAND}.\n")
             continue
 
         # Get command and arguments from input string
@@ -268,16 +288,16 @@ def main_alternative():
 
         # Match input command with command from the menu
         command = resolve_command(command)
-        metadata = menu.get(command)
+        metadata = MENU.get(command)
         if not metadata:
-            print(handle_unknown())
+            write(handle_unknown() + "\n")
             continue
 
         # Call handling function
         handler = metadata.get("handler")
         result = handler(args, book)
         if result:
-            print(result)
+            write(result + "\n")
 
 
 if __name__ == "__main__":
@@ -286,5 +306,5 @@ if __name__ == "__main__":
         # Launch in the alternative mode (Data-Driven Menu)
         main_alternative()
     else:
-        # Launch in the typical mode (menu handling in match case)
+        # Launch in the typical mode (menu handling with handlers dict)
         main()
@@ -6,36 +6,96 @@ and manager for multiple contact records. It supports adding, retrieving,
 searching, and displaying records. Each record typically includes a name
 and a list of associated phone numbers.
 """
-from datetime import date, timedelta
-from collections import UserDict
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from collections import Counter
+from functools import partial
+from operator import attrgetter
+from typing import Callable
 
 from services.address_book.record import Record
 
+from utils.constants import (
+    PHONES_BLOB_SEPARATOR,
+    SEARCH_MATCH_CACHE_SIZE,
+    SEARCH_NGRAM_LENGTH,
+    SEARCH_RECORDS_SEPARATOR,
+)
 from utils.date_utils import is_leap_year, parse_date
-from utils.text_utils import format_contacts_output
+from utils.text_utils import format_contacts_output, get_ngrams
 from validators.errors import ValidationError
 from validators.args_validators import validate_argument_type
 from validators.contact_validators import (
     ensure_contacts_storage_not_empty,
     ensure_contact_not_in_contacts_storage,
     ensure_contact_is_in_contacts_storage,
+    ensure_contact_name_unchanged,
 )
 
+# Days in a non-leap year before the first day of each month (indexed by month)
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+# Sort key for records by their case-insensitive name
+_by_casefolded_name = attrgetter("name.casefolded")
+# Days to move a congratulation to the following Monday (indexed by weekday)
+_WEEKEND_SHIFT = (0, 0, 0, 0, 0, 2, 1)
+
 
-class AddressBook(UserDict):
+class AddressBook(dict):
     """
     A class for storing and managing contact records.
 
-    Attributes:
-        data (dict): A dictionary where keys are contact names and values are Record objects.
+    The address book is a dictionary where keys are contact names and values
+    are Record objects.
 
     Functionality:
         - Add new contacts
         - Find contacts by name or phone
         - Delete contacts
         - Display all records in aligned output
+
+    Contacts are searched with the help of an inverted index, which maps
+    n-grams of case-folded names and phone numbers to the usernames of
+    the records containing them. The index is updated incrementally when
+    records are added or deleted and when phone numbers of a record change.
+
+    Dict mutators (item assignment and deletion, pop, popitem, update, setdefault,
+    clear and |=) are overridden, so the indexes are kept in sync whichever way
+    the book is changed. Like a dict, the book can be created from initial data.
+
+    Contacts are stored by name, so renaming a contact held by the book is
+    rejected with ValidationError.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        # Case-folded username -> username key, for case-insensitive lookups
+        self._casefold_index: dict[str, str] = {}
+        # Case-folded usernames kept in sorted order, for listing all contacts
+        self._sorted_casefold_names: list[str] = []
+        # Inverted search index: n-gram -> usernames of records containing it
+        self._name_ngrams: dict[str, set[str]] = {}
+        self._phone_ngrams: dict[str, set[str]] = {}
+        # Indexed data per username: (name n-grams, phone n-grams)
+        self._indexed_records: dict[str, tuple[set[str], set[str]]] = {}
+        # Phone and birthday changes observers registered on each record,
+        # to unsubscribe on delete
+        self._phones_observers: dict[str, Callable[[Record], None]] = {}
+        self._birthday_observers: dict[str, Callable[[Record], None]] = {}
+        # All records joined into one byte string for full scans, built lazily:
+        # (scan buffer, start offset of each record in it, records sorted by name)
+        self._scan_data: tuple[bytes, list[int], list[Record]] | None = None
+        # Number of contacts per name length, to track the longest name length
+        self._name_len_counts: Counter[int] = Counter()
+        self._max_name_len = 0
+        # Records with a birthday set, for upcoming birthdays lookups
+        self._birthday_records: dict[str, Record] = {}
+        # Contacts listing and search matches per case-folded term,
+        # both dropped after the book or any of its records change
+        self._str_cache: str | None = None
+        self._match_cache: dict[str, list[Record]] = {}
+
+        self.update(*args, **kwargs)
+
     def __str__(self) -> str:
         """
         Returns a formatted string listing all contacts.
@@ -43,19 +103,82 @@ class AddressBook(UserDict):
         Raises:
             ValidationError: If the address book is empty.
         """
-        ensure_contacts_storage_not_empty(self.data)
-        return format_contacts_output(self.to_dict())
+        if not self:
+            ensure_contacts_storage_not_empty(self)
+        if self._str_cache is None:
+            self._str_cache = format_contacts_output(
+                self.to_dict(), max_name_len=self._max_name_len
+            )
+        return self._str_cache
 
     def to_dict(self) -> dict:
         """
         Return a dictionary representation of the entire address book.
 
         Each key is a contact name, and the value is a dictionary of contact details.
+        A new dictionary is built on each call, so it may be modified by the caller.
 
         Returns:
             dict: Dictionary of contacts with serialized record data.
         """
-        return {key: record.to_dict() for key, record in self.data.items()}
+        return {key: record.to_dict() for key, record in self.items()}
+
+    def __setitem__(self, username: str, contact: Record) -> None:
+        """
+        Stores the contact under the given username, replacing an existing one.
+
+        Keeps lookup and search indexes in sync, like add_record().
+
+        Raises:
+            ValidationError: If the contact exists under a name in a different case.
+            TypeError: If contact is of incorrect type
+        """
+        validate_argument_type(contact, Record)
+        if username in self:
+            self._discard_record(username)
+        else:
+            ensure_contact_not_in_contacts_storage(username, self, self._casefold_index)
+        self._store_record(username, contact)
+
+    def __delitem__(self, username: str) -> None:
+        if username not in self:
+            raise KeyError(username)
+        self._discard_record(username)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        # Rebuild copies through __setitem__, so they get indexes of their own
+        return self.__class__, (), None, None, iter(self.items())
+
+    def copy(self) -> "AddressBook":
+        return self.__class__(self)
+
+    def pop(self, username: str, *default):
+        if username not in self:
+            return super().pop(username, *default)
+        return self._discard_record(username)
+
+    def popitem(self) -> tuple[str, Record]:
+        if not self:
+            return super().popitem()
+        username = next(reversed(self.keys()))
+        return username, self._discard_record(username)
+
+    def clear(self) -> None:
+        for username in list(self):
+            self._discard_record(username)
+
+    def update(self, *args, **kwargs) -> None:
+        for username, contact in dict(*args, **kwargs).items():
+            self[username] = contact
+
+    def setdefault(self, username: str, default: Record = None) -> Record:
+        if username not in self:
+            self[username] = default
+        return self[username]
 
     def add_record(self, contact: Record) -> None:
         """
@@ -74,10 +197,11 @@ class AddressBook(UserDict):
         validate_argument_type(contact, Record)
 
         # Prevent from overwriting existing entities
-        ensure_contact_not_in_contacts_storage(contact.name.value, self.data)
+        ensure_contact_not_in_contacts_storage(
+            contact.name.value, self, self._casefold_index
+        )
 
-        username = contact.name.value
-        self.data[username] = contact
+        self._store_record(contact.name.value, contact)
 
     def find(self, username: str) -> Record:
         """
@@ -92,9 +216,15 @@ class AddressBook(UserDict):
         Returns:
             Record: The matching contact.
         """
-        ensure_contacts_storage_not_empty(self.data)
-        contact = ensure_contact_is_in_contacts_storage(username, self.data)
-        return contact
+        contact = self.get(username)
+        if contact is not None:
+            return contact
+
+        # Miss path: report an empty book, unknown name or a case-only mismatch
+        ensure_contacts_storage_not_empty(self)
+        return ensure_contact_is_in_contacts_storage(
+            username, self, self._casefold_index
+        )
 
     def find_match(self, search_term: str = "") -> list[Record]:
         """
@@ -107,31 +237,26 @@ class AddressBook(UserDict):
             ValidationError: If address book is empty.
 
         Returns:
-            list[Record]: List of matched contacts.
+            list[Record]: List of matched contacts sorted by name.
+                          For an empty search term all contacts.
         """
-        ensure_contacts_storage_not_empty(self)
-
-        matches = []
+        if not self:
+            ensure_contacts_storage_not_empty(self)
 
         if not search_term:
-            matches = list(self.data.values())
-        else:
-            for record in self.data.values():
-                if search_term.casefold() in record.name.value.casefold():
-                    # Full match, case insensitive
-                    matches.append(record)
-                else:
-                    # Partial match, case insensitive
-                    if any(
-                        search_term.casefold() in phone.value.casefold()
-                        for phone in record.phones
-                    ):
-                        matches.append(record)
-
-        if not matches:
-            return []
-
-        return matches
+            return self._get_sorted_records()
+
+        term = search_term.casefold()
+        match_cache = self._match_cache
+        matches = match_cache.pop(term, None)
+        if matches is None:
+            if len(match_cache) >= SEARCH_MATCH_CACHE_SIZE:
+                # Forget the least recently used search term
+                del match_cache[next(iter(match_cache))]
+            matches = self._find_term_matches(term)
+        # (Re)insert the term as the most recently used one
+        match_cache[term] = matches
+        return list(matches)
 
     def delete(self, username: str) -> None:
         """
@@ -146,8 +271,9 @@ class AddressBook(UserDict):
         Returns:
             str: A message confirming deletion.
         """
-        ensure_contact_is_in_contacts_storage(username, self.data)
-        self.data.pop(username)
+        if username not in self:
+            ensure_contact_is_in_contacts_storage(username, self, self._casefold_index)
+        self._discard_record(username)
 
     def get_upcoming_birthdays(
         self, today: str = None, upcoming_period_days: int = 7
@@ -170,64 +296,42 @@ class AddressBook(UserDict):
             today_obj = parse_date(today)
 
         # Empty data guard
-        if not self.data:
+        if not self._birthday_records:
             return []
 
+        # Compare birthdays as day ordinals to avoid building dates for every record
+        today_ord = today_obj.toordinal()
+        till_ord = today_ord + upcoming_period_days
+        this_year_start = (
+            date(today_obj.year, 1, 1).toordinal(),
+            is_leap_year(today_obj.year),
+        )
+        next_year_start = (
+            date(today_obj.year + 1, 1, 1).toordinal(),
+            is_leap_year(today_obj.year + 1),
+        )
+
         user_congratulations = []
 
-        for record in self.data.values():
-            # Retrieve birthday object
-            birthday = record.birthday
-
-            # Guard records without assigned birthday
-            if not birthday:
-                continue
-
-            # Handle the case if birthday is today or upcoming
-            # Handle the case for February 29 birthday
-            if birthday.value.month == 2 and birthday.value.day == 29:
-                if is_leap_year(today_obj.year):
-                    # For leap years, keep February 29
-                    birthday_this_year = birthday.value.replace(year=today_obj.year)
-                else:
-                    # For non-leap years, set birthday to March 1
-                    birthday_this_year = birthday.value.replace(
-                        year=today_obj.year, month=3, day=1
-                    )
-            else:
-                # For other birthdays, just replace the year
-                birthday_this_year = birthday.value.replace(year=today_obj.year)
-
-            # Handle the case if birthday has passed, adjust to next year
-            if birthday_this_year < today_obj:
-                # If it's a February 29 birthday in a non-leap year,
-                # adjust it to March 1 of next year
-                if birthday_this_year.month == 2 and birthday_this_year.day == 29:
-                    if not is_leap_year(today_obj.year + 1):
-                        birthday_this_year = birthday_this_year.replace(
-                            year=today_obj.year + 1, month=3, day=1
-                        )
-                    else:
-                        birthday_this_year = birthday_this_year.replace(
-                            year=today_obj.year + 1
-                        )
-                else:
-                    # Otherwise just move it to the next year
-                    birthday_this_year = birthday_this_year.replace(
-                        year=today_obj.year + 1
-                    )
+        # Only records with an assigned birthday are checked
+        for record in self._birthday_records.values():
+            # Handle the case if birthday is today or upcoming,
+            # if birthday has passed, adjust it to the next year
+            month, day = record.birthday.month_day
+            birthday_ord = _get_day_ordinal(*this_year_start, month, day)
+            if birthday_ord < today_ord:
+                birthday_ord = _get_day_ordinal(*next_year_start, month, day)
 
             # Filter dates in upcoming period range and add them to the congratulations list
-            from_date = today_obj
-            till_date = today_obj + timedelta(upcoming_period_days)
-            is_in_upcoming_rage = from_date <= birthday_this_year <= till_date
+            is_in_upcoming_rage = birthday_ord <= till_ord
             if is_in_upcoming_rage:
-                congratulation_date = birthday_this_year
+                birthday_this_year = date.fromordinal(birthday_ord)
                 # Move weekend congratulation to the following Monday
-                if birthday_this_year.weekday() == 5:  # Saturday moved to Monday
-                    congratulation_date += timedelta(days=2)
-                elif birthday_this_year.weekday() == 6:  # Sunday moved to Monday
-                    congratulation_date += timedelta(days=1)
+                # (ordinal 1 is a Monday, so the weekday is (ordinal - 1) % 7)
+                weekend_shift = _WEEKEND_SHIFT[(birthday_ord - 1) % 7]
+                congratulation_date = birthday_this_year
+                if weekend_shift:
+                    congratulation_date = date.fromordinal(birthday_ord + weekend_shift)
 
                 # Add congratulation date object to the list
                 user_congratulations.append(
@@ -245,6 +349,242 @@ class AddressBook(UserDict):
 
         return user_congratulations
 
+    def _store_record(self, username: str, contact: Record) -> None:
+        """Stores the record under the username and adds it to all indexes."""
+        super().__setitem__(username, contact)
+        casefolded_name = username.casefold()
+        self._casefold_index[casefolded_name] = username
+        insort(self._sorted_casefold_names, casefolded_name)
+        self._index_record(username, contact)
+
+        if contact.birthday:
+            self._birthday_records[username] = contact
+        observer = partial(self._on_record_birthday_changed, username)
+        self._birthday_observers[username] = observer
+        contact.add_birthday_observer(observer)
+        self._invalidate_caches()
+
+        name_len = len(username)
+        self._name_len_counts[name_len] += 1
+        self._max_name_len = max(self._max_name_len, name_len)
+
+    def _discard_record(self, username: str) -> Record:
+        """Removes the record stored under the username from all indexes."""
+        self._unindex_record(username)
+        self._birthday_records.pop(username, None)
+        contact = super().pop(username)
+        contact.remove_birthday_observer(self._birthday_observers.pop(username))
+        self._invalidate_caches()
+        casefolded_name = username.casefold()
+        self._casefold_index.pop(casefolded_name)
+        sorted_names = self._sorted_casefold_names
+        sorted_names.pop(bisect_left(sorted_names, casefolded_name))
+
+        name_len = len(username)
+        self._name_len_counts[name_len] -= 1
+        if not self._name_len_counts[name_len]:
+            del self._name_len_counts[name_len]
+            if name_len == self._max_name_len:
+                self._max_name_len = max(self._name_len_counts, default=0)
+
+        return contact
+
+    def _index_record(self, username: str, record: Record) -> None:
+        """
+        Adds the record to the search index and subscribes to its name and phone
+        changes.
+        """
+        name_ngrams = get_ngrams(record.name.casefolded)
+        phone_ngrams = self._get_phone_ngrams(record)
+
+        _add_postings(self._name_ngrams, name_ngrams, username)
+        _add_postings(self._phone_ngrams, phone_ngrams, username)
+
+        self._indexed_records[username] = (name_ngrams, phone_ngrams)
+        self._scan_data = None
+
+        observer = partial(self._reindex_record_phones, username)
+        self._phones_observers[username] = observer
+        record.add_phones_observer(observer)
+        record.add_name_validator(self._validate_record_rename)
+
+    def _unindex_record(self, username: str) -> None:
+        """Removes the record from the search index and unsubscribes from changes."""
+        name_ngrams, phone_ngrams = self._indexed_records.pop(username)
+
+        _remove_postings(self._name_ngrams, name_ngrams, username)
+        _remove_postings(self._phone_ngrams, phone_ngrams, username)
+        self._scan_data = None
+
+        record = self[username]
+        record.remove_phones_observer(self._phones_observers.pop(username))
+        record.remove_name_validator(self._validate_record_rename)
+
+    def _reindex_record_phones(self, username: str, record: Record) -> None:
+        """Updates the search index with the changed phone numbers of the record."""
+        name_ngrams, old_phone_ngrams = self._indexed_records[username]
+        new_phone_ngrams = self._get_phone_ngrams(record)
+
+        _remove_postings(
+            self._phone_ngrams, old_phone_ngrams - new_phone_ngrams, username
+        )
+        _add_postings(self._phone_ngrams, new_phone_ngrams - old_phone_ngrams, username)
+
+        self._indexed_records[username] = (name_ngrams, new_phone_ngrams)
+        self._scan_data = None
+        self._invalidate_caches()
+
+    def _validate_record_rename(self, record: Record, username: str) -> None:
+        # Keys, indexes and listing all follow the name, so it must not change
+        ensure_contact_name_unchanged(username, record)
+
+    def _on_record_birthday_changed(self, username: str, record: Record) -> None:
+        if record.birthday:
+            self._birthday_records[username] = record
+        else:
+            self._birthday_records.pop(username, None)
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        self._str_cache = None
+        self._match_cache.clear()
+
+    def _find_term_matches(self, term: str) -> list[Record]:
+        """Returns records matching the case-folded search term, sorted by name."""
+        term_bytes = term.encode()
+
+        if len(term) < SEARCH_NGRAM_LENGTH:
+            # Term is too short to be covered by the index - scan all records
+            if not _has_scan_separator(term_bytes):
+                return self._scan_all_records(term_bytes)
+            records = self._get_sorted_records()
+        else:
+            # Check only records containing all n-grams of the search term
+            records = self._find_index_candidates(term)
+
+        # Partial, case insensitive match by name or by any of the phones.
+        # Digit-only terms are most likely phone numbers, so check phones first.
+        if term.isdigit():
+            return [
+                record
+                for record in records
+                if term_bytes in record.phones_blob or term in record.name.casefolded
+            ]
+        return [
+            record
+            for record in records
+            if term in record.name.casefolded or term_bytes in record.phones_blob
+        ]
+
+    def _scan_all_records(self, term_bytes: bytes) -> list[Record]:
+        """
+        Returns records whose name or phones contain the search term, sorted by name,
+        with a single substring search over all records at once.
+
+        Each hit found in the scan buffer is mapped to its record, and the search
+        continues from the start of the next record.
+        """
+        if self._scan_data is None:
+            self._scan_data = self._build_scan_data()
+        buffer, offsets, records = self._scan_data
+
+        matches = []
+        idx = buffer.find(term_bytes)
+        while idx != -1:
+            record_idx = bisect_right(offsets, idx) - 1
+            matches.append(records[record_idx])
+            if record_idx + 1 == len(offsets):
+                break
+            idx = buffer.find(term_bytes, offsets[record_idx + 1])
+        return matches
+
+    def _build_scan_data(self) -> tuple[bytes, list[int], list[Record]]:
+        records = self._get_sorted_records()
+        chunks = []
+        offsets = []
+        offset = 0
+        for record in records:
+            chunk = (
+                record.name.casefolded.encode()
+                + PHONES_BLOB_SEPARATOR
+                + record.phones_blob
+            )
+            chunks.append(chunk)
+            offsets.append(offset)
+            offset += len(chunk) + len(SEARCH_RECORDS_SEPARATOR)
+        buffer = SEARCH_RECORDS_SEPARATOR.join(chunks)
+        return buffer, offsets, records
+
+    def _find_index_candidates(self, term: str) -> list[Record]:
+        """
+        Returns records which may contain the search term, sorted by name.
+
+        A record is a candidate if its name or one of its phones contains
+        all n-grams of the search term. Candidates still need to be verified.
+        """
+        term_ngrams = get_ngrams(term)
+        name_candidates = _intersect_postings(self._name_ngrams, term_ngrams)
+        phone_candidates = _intersect_postings(self._phone_ngrams, term_ngrams)
+        candidates = [self[username] for username in name_candidates | phone_candidates]
+        candidates.sort(key=_by_casefolded_name)
+        return candidates
+
+    def _get_sorted_records(self) -> list[Record]:
+        """Returns all records sorted by case-folded name."""
+        casefold_index = self._casefold_index
+        return [
+            self[casefold_index[casefolded_name]]
+            for casefolded_name in self._sorted_casefold_names
+        ]
+
+    @staticmethod
+    def _get_phone_ngrams(record: Record) -> set[str]:
+        phone_ngrams = set()
+        for phone_number in record.phones:
+            phone_ngrams |= get_ngrams(phone_number.casefold())
+        return phone_ngrams
+
+
+def _get_day_ordinal(year_start_ord: int, is_leap: bool, month: int, day: int) -> int:
+    """
+    Returns the proleptic Gregorian ordinal of the given month and day in a year
+    starting at the given ordinal. February 29 falls on March 1 in non-leap years.
+    """
+    if month == 2 and day == 29 and not is_leap:
+        month, day = 3, 1
+    leap_day = month > 2 and is_leap
+    return year_start_ord + _DAYS_BEFORE_MONTH[month] + leap_day + day - 1
+
+
+def _has_scan_separator(term_bytes: bytes) -> bool:
+    return PHONES_BLOB_SEPARATOR in term_bytes or SEARCH_RECORDS_SEPARATOR in term_bytes
+
+
+def _add_postings(index: dict[str, set[str]], ngrams: set[str], key: str) -> None:
+    for ngram in ngrams:
+        index.setdefault(ngram, set()).add(key)
+
+
+def _remove_postings(index: dict[str, set[str]], ngrams: set[str], key: str) -> None:
+    for ngram in ngrams:
+        postings = index[ngram]
+        postings.discard(key)
+        if not postings:
+            del index[ngram]
+
+
+def _intersect_postings(index: dict[str, set[str]], ngrams: set[str]) -> set[str]:
+    postings = []
+    for ngram in ngrams:
+        ngram_postings = index.get(ngram)
+        if not ngram_postings:
+            return set()
+        postings.append(ngram_postings)
+
+    # Start intersection from the most selective n-gram
+    postings.sort(key=len)
+    return postings[0].intersection(*postings[1:])
+
 
 if __name__ == "__main__":
     # Basic tests to verify AddressBook logic
@@ -252,7 +592,7 @@ if __name__ == "__main__":
     # Setup
 
     test_book = AddressBook()
-    assert len(test_book.data) == 0
+    assert len(test_book) == 0
 
     test_record_1 = Record("Alice")
     test_record_1.add_phone("1234567890")
@@ -284,11 +624,11 @@ if __name__ == "__main__":
         assert str(exc) == "Expected type 'Record', but received type 'object'."
     else:
         assert False, "Should raise TypeError error when incorrect type"
-    assert len(test_book.data) == 0
+    assert len(test_book) == 0
 
     # Test add contact - first contact
     test_book.add_record(test_record_1)
-    assert len(test_book.data) == 1
+    assert len(test_book) == 1
 
     # Test __str__ with 1 record
     TEST_MSG_BOOK_STR_1_CONTACT = "You have 1 contact:\n  Alice : phones 1234567890"
@@ -296,7 +636,7 @@ if __name__ == "__main__":
 
     # Test add contact - second contact
     test_book.add_record(test_record_2)
-    assert len(test_book.data) == 2
+    assert len(test_book) == 2
 
     # Test __str__ with 2 records
     TEST_MSG_BOOK_STR_2_CONTACTS = (
@@ -308,7 +648,7 @@ if __name__ == "__main__":
 
     # Test add contact - record with empty phones as third contact
     test_book.add_record(test_record_empty)
-    assert len(test_book.data) == 3
+    assert len(test_book) == 3
 
     # Test __str__ with 3 records
     TEST_MSG_BOOK_STR_3_CONTACTS = (
@@ -326,7 +666,7 @@ if __name__ == "__main__":
         assert str(exc) == TEST_MSG_CONTACT_ALREADY_EXISTS
     else:
         assert False, "Should raise Validation error"
-    assert len(test_book.data) == 3
+    assert len(test_book) == 3
 
     # Test find - found contact
     TEST_FIND_USERNAME = "Alice"
@@ -335,7 +675,7 @@ if __name__ == "__main__":
     assert found_contact
     assert found_contact.name.value == TEST_FIND_USERNAME
     assert len(found_contact.phones) == 1
-    assert found_contact.phones[0].value == TEST_USERNAME_PHONE
+    assert list(found_contact.phones) == [TEST_USERNAME_PHONE]
 
     # Test find - contact not found
     try:
@@ -419,7 +759,7 @@ if __name__ == "__main__":
     assert any(
         [
             TEST_MATCH_PHONE_SEARCH_TERM_1 in phone.value
-            for phone in test_match_phone_result_1[0].phones
+            for phone in test_match_phone_result_1[0].phones.values()
         ]
     )
     # multiple results
@@ -428,16 +768,18 @@ if __name__ == "__main__":
         TEST_MATCH_PHONE_SEARCH_TERM_2
     )
     assert len(test_match_phone_result_2) == 2
+    # results are sorted by name
+    assert test_match_phone_result_2 == [test_match_record_3, test_match_record_2]
     assert any(
         [
-            TEST_MATCH_PHONE_SEARCH_TERM_1 in phone.value
-            for phone in test_match_phone_result_2[0].phones
+            TEST_MATCH_PHONE_SEARCH_TERM_2 in phone.value
+            for phone in test_match_phone_result_2[0].phones.values()
         ]
     )
     assert any(
         [
-            TEST_MATCH_PHONE_SEARCH_TERM_2 in phone.value
-            for phone in test_match_phone_result_2[1].phones
+            TEST_MATCH_PHONE_SEARCH_TERM_1 in phone.value
+            for phone in test_match_phone_result_2[1].phones.values()
         ]
     )
 
@@ -454,6 +796,69 @@ if __name__ == "__main__":
         TEST_MATCH_PHONE_SEARCH_TERM_EMPTY
     )
     assert len(test_match_empty_result) == 4
+    assert test_match_empty_result == [
+        test_match_record_3,
+        test_match_record_1,
+        test_match_record_2,
+        test_match_record_4,
+    ]
+
+    # Test find match - search index is kept in sync with record changes
+    test_index_book = AddressBook()
+
+    test_index_record_1 = Record("Alice")
+    test_index_record_1.add_phone("1234567890")
+    test_index_book.add_record(test_index_record_1)
+
+    test_index_record_2 = Record("Bob")
+    test_index_book.add_record(test_index_record_2)
+
+    assert test_index_book.find_match("LIC") == [test_index_record_1]
+    assert test_index_book.find_match("456") == [test_index_record_1]
+    assert not test_index_book.find_match("555")
+
+    # phone added after the record was added to the book
+    test_index_record_2.add_phone("5556667770")
+    assert test_index_book.find_match("555") == [test_index_record_2]
+
+    # phone edited and updated directly
+    test_index_record_2.edit_phone("5556667770", "1114567770")
+    assert not test_index_book.find_match("555")
+    assert test_index_book.find_match("456") == [
+        test_index_record_1,
+        test_index_record_2,
+    ]
+    test_index_record_2.find_phone("1114567770").update_phone("9999999999")
+    assert test_index_book.find_match("456") == [test_index_record_1]
+    assert test_index_book.find_match("999") == [test_index_record_2]
+
+    # phone removed
+    test_index_record_2.remove_phone("9999999999")
+    assert not test_index_book.find_match("999")
+
+    # record deleted
+    test_index_book.delete("Alice")
+    assert not test_index_book.find_match("lic")
+    assert not test_index_book.find_match("456")
+    test_index_record_1.add_phone("9999999999")
+    assert not test_index_book.find_match("999")
+
+    # Test find match - search index of every book holding the record is kept in sync
+    test_shared_book_1 = AddressBook()
+    test_shared_book_2 = AddressBook()
+    test_shared_record = Record("Carol")
+    test_shared_book_1.add_record(test_shared_record)
+    test_shared_book_2.add_record(test_shared_record)
+
+    test_shared_record.add_phone("5551112222")
+    assert test_shared_book_1.find_match("555") == [test_shared_record]
+    assert test_shared_book_2.find_match("555") == [test_shared_record]
+
+    # deleting the record from one book keeps the other one in sync
+    test_shared_book_2.delete("Carol")
+    test_shared_record.edit_phone("5551112222", "7771112222")
+    assert not test_shared_book_1.find_match("555")
+    assert test_shared_book_1.find_match("777") == [test_shared_record]
 
     # Test delete contact
     test_delete_book = AddressBook()
@@ -475,14 +880,14 @@ if __name__ == "__main__":
     test_delete_book.add_record(test_match_record_3)
     test_delete_book.add_record(test_match_record_4)
 
-    assert len(test_delete_book.data) == 4
+    assert len(test_delete_book) == 4
     try:
         test_delete_book.delete("unknown_when_with_contacts")
     except ValidationError as exc:
         assert str(exc) == "Contact 'unknown_when_with_contacts' not found."
     else:
         assert False, "Should raise Validation error"
-    assert len(test_delete_book.data) == 4
+    assert len(test_delete_book) == 4
 
     try:
         test_delete_book.delete("alex")
@@ -493,7 +898,7 @@ if __name__ == "__main__":
         )
     else:
         assert False, "Should raise Validation error"
-    assert len(test_delete_book.data) == 4
+    assert len(test_delete_book) == 4
 
     try:
         test_delete_book.delete("     Alex   ")
@@ -501,23 +906,23 @@ if __name__ == "__main__":
         assert str(exc) == "Contact '     Alex   ' not found."
     else:
         assert False, "Should raise Validation error"
-    assert len(test_delete_book.data) == 4
+    assert len(test_delete_book) == 4
 
     test_delete_book.delete("Alex")
-    assert "Alex" not in test_delete_book.data
-    assert len(test_delete_book.data) == 3
+    assert "Alex" not in test_delete_book
+    assert len(test_delete_book) == 3
 
     test_delete_book.delete("Alice")
-    assert "Alice" not in test_delete_book.data
-    assert len(test_delete_book.data) == 2
+    assert "Alice" not in test_delete_book
+    assert len(test_delete_book) == 2
 
     test_delete_book.delete("Bob")
-    assert "Bob" not in test_delete_book.data
-    assert len(test_delete_book.data) == 1
+    assert "Bob" not in test_delete_book
+    assert len(test_delete_book) == 1
 
     test_delete_book.delete("NoPhone")
-    assert "NoPhone" not in test_delete_book.data
-    assert len(test_delete_book.data) == 0
+    assert "NoPhone" not in test_delete_book
+    assert len(test_delete_book) == 0
 
     try:
         test_delete_book.delete("unknown_when_no_contacts")
@@ -525,7 +930,210 @@ if __name__ == "__main__":
         assert str(exc) == "Contact 'unknown_when_no_contacts' not found."
     else:
         assert False, "Should raise Validation error"
-    assert len(test_delete_book.data) == 0
+    assert len(test_delete_book) == 0
+
+    # Test case-insensitive lookup index is kept in sync on add and delete
+    test_casefold_book = AddressBook()
+    test_casefold_book.add_record(Record("Alex"))
+    assert test_casefold_book._casefold_index == {"alex": "Alex"}
+    assert test_casefold_book.find("Alex").name.value == "Alex"
+    try:
+        test_casefold_book.find("ALEX")
+        assert False, "Expected ValidationError for different case"
+    except ValidationError as e:
+        assert "Did you mean 'Alex'?" in str(e)
+    try:
+        test_casefold_book.add_record(Record("aLeX"))
+        assert False, "Expected ValidationError for duplicate name"
+    except ValidationError as e:
+        assert "under a different name: 'Alex'" in str(e)
+    test_casefold_book.delete("Alex")
+    assert not test_casefold_book._casefold_index
+    test_casefold_book.add_record(Record("aLeX"))
+    assert test_casefold_book._casefold_index == {"alex": "aLeX"}
+
+    # Test indexes are kept in sync when the book is changed with dict mutators
+    test_mutators_book = AddressBook()
+    test_mutators_record_1 = Record("Alice")
+    test_mutators_record_1.add_phone("1112223333")
+    test_mutators_record_2 = Record("Bob")
+    test_mutators_book["Alice"] = test_mutators_record_1
+    test_mutators_book.update({"Bob": test_mutators_record_2})
+    assert test_mutators_book.find_match("") == [
+        test_mutators_record_1,
+        test_mutators_record_2,
+    ]
+    assert test_mutators_book.pop("Alice") is test_mutators_record_1
+    assert test_mutators_book.find_match("") == [test_mutators_record_2]
+    assert not test_mutators_book.find_match("111")
+    test_mutators_book.add_record(Record("alice"))
+    del test_mutators_book["alice"]
+    test_mutators_book.setdefault("Carol", Record("Carol"))
+    assert test_mutators_book.find_match("car")[0].name.value == "Carol"
+    test_mutators_book.clear()
+    assert not test_mutators_book._casefold_index
+    assert not test_mutators_book._name_ngrams
+    test_mutators_book |= {"Dave": Record("Dave")}
+    assert test_mutators_book.find("Dave").name.value == "Dave"
+    try:
+        test_mutators_book["dave"] = Record("dave")
+        assert False, "Expected ValidationError for duplicate name"
+    except ValidationError as e:
+        assert "under a different name: 'Dave'" in str(e)
+
+    # Test book is created from initial data and copied with indexes of its own
+    test_initial_record = Record("Erin")
+    test_initial_record.add_phone("4445556666")
+    test_initial_book = AddressBook({"Erin": test_initial_record})
+    assert test_initial_book.find_match("555") == [test_initial_record]
+    test_copied_book = test_initial_book.copy()
+    assert isinstance(test_copied_book, AddressBook)
+    test_copied_book.delete("Erin")
+    assert test_initial_book.find_match("555") == [test_initial_record]
+    test_initial_record.edit_phone("4445556666", "7778889999")
+    assert test_initial_book.find_match("888") == [test_initial_record]
+
+    # Test find match - single symbol terms are matched with a scan over all records,
+    # two symbol terms are matched with the bigram index
+    test_scan_book = AddressBook()
+    test_scan_record_1 = Record("Anna")
+    test_scan_record_1.add_phone("1234567890")
+    test_scan_record_2 = Record("Bob")
+    test_scan_record_2.add_phone("5555555555")
+    test_scan_record_3 = Record("Nina")
+    test_scan_book.add_record(test_scan_record_1)
+    test_scan_book.add_record(test_scan_record_2)
+    test_scan_book.add_record(test_scan_record_3)
+    assert test_scan_book.find_match("NN") == [test_scan_record_1]
+    assert test_scan_book.find_match("n") == [test_scan_record_1, test_scan_record_3]
+    assert test_scan_book.find_match("55") == [test_scan_record_2]
+    # terms crossing name and phones or neighbour records boundaries do not match
+    assert not test_scan_book.find_match("a1")
+    assert not test_scan_book.find_match("0b")
+    test_scan_record_3.add_phone("0000000055")
+    assert test_scan_book.find_match("55") == [test_scan_record_2, test_scan_record_3]
+    test_scan_book.delete("Bob")
+    assert test_scan_book.find_match("55") == [test_scan_record_3]
+
+    # Test contacts listing is cached until the book or its records change
+    test_cache_book = AddressBook()
+    test_cache_record = Record("Alice")
+    test_cache_record.add_phone("1234567890")
+    test_cache_book.add_record(test_cache_record)
+    test_cache_str = str(test_cache_book)
+    assert str(test_cache_book) is test_cache_str
+    test_cache_book.to_dict()["Alice"]["phones"].append("0000000000")
+    assert str(test_cache_book) is test_cache_str
+    test_cache_record.add_phone("0987654321")
+    assert "0987654321" in str(test_cache_book)
+    assert test_cache_book.to_dict()["Alice"]["phones"] == ["1234567890", "0987654321"]
+    test_cache_record.add_birthday("01.01.2000")
+    assert "01.01.2000" in str(test_cache_book)
+    test_cache_record.add_birthday("02.01.2000")
+    assert "02.01.2000" in str(test_cache_book)
+    test_cache_book.add_record(Record("Bob"))
+    assert "Bob" in str(test_cache_book)
+    test_cache_book.delete("Bob")
+    assert "Bob" not in str(test_cache_book)
+    assert "Bob" not in test_cache_book.to_dict()
+
+    # listing is refreshed when record fields are assigned or changed in place
+    test_cache_record.birthday = None
+    assert "birthday" not in str(test_cache_book)
+    test_cache_record.add_birthday("03.01.2000")
+    test_cache_record.birthday.value = "04.01.2000"
+    assert "04.01.2000" in str(test_cache_book)
+    assert "04.01.2000" in str(test_cache_record)
+
+    # listing of every book holding the record is refreshed
+    test_cache_book_other = AddressBook()
+    test_cache_book_other.add_record(test_cache_record)
+    assert "1234567890" in str(test_cache_book_other)
+    test_cache_record.add_phone("5555555555")
+    assert "5555555555" in str(test_cache_book)
+    assert "5555555555" in str(test_cache_book_other)
+
+    # Test renaming a contact held by the book is rejected, as it is stored by name
+    test_rename_book = AddressBook()
+    for test_rename_username in ("Alice", "Bob", "Carl"):
+        test_rename_book.add_record(Record(test_rename_username))
+    test_rename_record = test_rename_book["Bob"]
+    try:
+        test_rename_record.name.value = "Zed"
+    except ValidationError as exc:
+        assert str(exc) == (
+            "Contact 'Bob' is in the address book and can't be renamed to 'Zed'."
+        )
+    else:
+        assert False, "Should raise Validation error when renaming a contact in book"
+    assert test_rename_record.name.value == "Bob"
+    assert [r.name.value for r in test_rename_book.find_match("")] == [
+        "Alice",
+        "Bob",
+        "Carl",
+    ]
+    assert test_rename_book.find("Bob") is test_rename_record
+    test_rename_record.name.value = " Bob "  # same name is not a rename
+    # deleted contact can be renamed again
+    test_rename_book.delete("Bob")
+    test_rename_record.name.value = "Zed"
+    test_rename_book.add_record(test_rename_record)
+    assert [r.name.value for r in test_rename_book.find_match("")] == [
+        "Alice",
+        "Carl",
+        "Zed",
+    ]
+
+    # Test find match - matches are remembered per term until the book changes
+    test_match_cache_book = AddressBook()
+    test_match_cache_record = Record("Alice")
+    test_match_cache_book.add_record(test_match_cache_record)
+    test_match_cache_result = test_match_cache_book.find_match("ali")
+    assert test_match_cache_result == [test_match_cache_record]
+    test_match_cache_result.clear()  # returned list is a copy
+    assert test_match_cache_book.find_match("ALI") == [test_match_cache_record]
+    assert list(test_match_cache_book._match_cache) == ["ali"]
+    assert not test_match_cache_book.find_match("123")
+    test_match_cache_record.add_phone("1234567890")
+    assert test_match_cache_book.find_match("123") == [test_match_cache_record]
+    for test_match_cache_term in range(SEARCH_MATCH_CACHE_SIZE + 1):
+        test_match_cache_book.find_match(f"term {test_match_cache_term}")
+    assert len(test_match_cache_book._match_cache) == SEARCH_MATCH_CACHE_SIZE
+    assert "term 0" not in test_match_cache_book._match_cache
+
+    # least recently used term is forgotten first, a hit makes a term most recent
+    test_match_cache_book.find_match("term 1")
+    test_match_cache_book.find_match("term new")
+    assert "term 1" in test_match_cache_book._match_cache
+    assert "term 2" not in test_match_cache_book._match_cache
+
+    # Test find match - matches are sorted by name regardless of insertion order
+    test_sorted_book = AddressBook()
+    test_sorted_record_1 = Record("nick")
+    test_sorted_record_1.add_phone("1234567890")
+    test_sorted_record_2 = Record("Anna")
+    test_sorted_record_2.add_phone("0123456789")
+    test_sorted_book.add_record(test_sorted_record_1)
+    test_sorted_book.add_record(test_sorted_record_2)
+    test_sorted_expected = [test_sorted_record_2, test_sorted_record_1]
+    assert test_sorted_book.find_match("") == test_sorted_expected
+    assert test_sorted_book.find_match("n") == test_sorted_expected
+    assert test_sorted_book.find_match("N") == test_sorted_expected
+    assert test_sorted_book.find_match("45") == test_sorted_expected
+
+    # Test longest name length is tracked on add and delete
+    test_name_len_book = AddressBook()
+    test_name_len_book.add_record(Record("Bob"))
+    test_name_len_book.add_record(Record("Alice"))
+    test_name_len_book.add_record(Record("Carol"))
+    assert test_name_len_book._max_name_len == 5
+    test_name_len_book.delete("Alice")
+    assert test_name_len_book._max_name_len == 5
+    test_name_len_book.delete("Carol")
+    assert test_name_len_book._max_name_len == 3
+    assert str(test_name_len_book) == "You have 1 contact:\n  Bob : phones "
+    test_name_len_book.delete("Bob")
+    assert test_name_len_book._max_name_len == 0
 
     # Test __str__ with 0 records after all have been deleted
     TEST_MSG_BOOK_STR_NO_CONTACTS_AFTER_DELETION = (
@@ -683,4 +1291,75 @@ if __name__ == "__main__":
     )
     assert birthdays_upcoming_period_2_expected == birthdays_upcoming_period_2_result
 
+    # birthdays - test February 29 birthday in leap and non-leap years
+    book_leap_day = AddressBook()
+    record_leap_day = Record("Dave")
+    record_leap_day.add_birthday("29.02.2000")
+    book_leap_day.add_record(record_leap_day)
+    assert book_leap_day.get_upcoming_birthdays(today="27.02.2024") == [
+        {
+            "name": "Dave",
+            "congratulation": date(2024, 2, 29),
+            "congratulation_actual": date(2024, 2, 29),
+        }
+    ]
+    assert book_leap_day.get_upcoming_birthdays(today="27.02.2025") == [
+        {
+            "name": "Dave",
+            "congratulation": date(2025, 3, 3),
+            "congratulation_actual": date(2025, 3, 1),
+        }
+    ]
+    assert book_leap_day.get_upcoming_birthdays(
+        today="02.03.2023", upcoming_period_days=365
+    ) == [
+        {
+            "name": "Dave",
+            "congratulation": date(2024, 2, 29),
+            "congratulation_actual": date(2024, 2, 29),
+        }
+    ]
+
+    # birthdays - test birthdays added to and records deleted from the book are tracked
+    book_tracked_birthdays = AddressBook()
+    record_tracked_birthday = Record("Eve")
+    book_tracked_birthdays.add_record(record_tracked_birthday)
+    assert not book_tracked_birthdays.get_upcoming_birthdays(today="01.01.2025")
+    record_tracked_birthday.add_birthday("02.01.2000")
+    assert book_tracked_birthdays.get_upcoming_birthdays(today="01.01.2025") == [
+        {
+            "name": "Eve",
+            "congratulation": date(2025, 1, 2),
+            "congratulation_actual": date(2025, 1, 2),
+        }
+    ]
+    book_tracked_birthdays.delete("Eve")
+    assert not book_tracked_birthdays.get_upcoming_birthdays(today="01.01.2025")
+
+    # birthdays - test directly assigned birthdays are tracked by every book
+    book_assigned_birthdays_1 = AddressBook()
+    book_assigned_birthdays_2 = AddressBook()
+    record_assigned_birthday = Record("Frank")
+    book_assigned_birthdays_1.add_record(record_assigned_birthday)
+    book_assigned_birthdays_2.add_record(record_assigned_birthday)
+    record_assigned_birthday.birthday = birthday_record_2.birthday
+    birthdays_assigned_expected = [
+        {
+            "name": "Frank",
+            "congratulation": date(2025, 1, 1),
+            "congratulation_actual": date(2025, 1, 1),
+        }
+    ]
+    assert (
+        book_assigned_birthdays_1.get_upcoming_birthdays(today="01.01.2025")
+        == birthdays_assigned_expected
+    )
+    assert (
+        book_assigned_birthdays_2.get_upcoming_birthdays(today="01.01.2025")
+        == birthdays_assigned_expected
+    )
+    book_assigned_birthdays_2.delete("Frank")
+    record_assigned_birthday.birthday = None
+    assert not book_assigned_birthdays_1.get_upcoming_birthdays(today="01.01.2025")
+
     print("AddressBook tests passed.")
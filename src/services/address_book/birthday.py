@@ -21,9 +21,12 @@ class Birthday(Field):
     Class for storing and validating birth dates.
 
     Ensures the date matches the expected birthday format during initialization
-    and on value changes.
+    and on value changes. The (month, day) pair and the display string of the date
+    are cached alongside the value.
     """
 
+    __slots__ = ("month_day", "_formatted")
+
     def __init__(self, date_value: str | date):
         """
         Initiates Birthday instance.
@@ -32,11 +35,10 @@ class Birthday(Field):
             TypeError: If date value is not one of incorrect types.
             ValidationError: If bad date format is provided.
         """
-        date_obj = self._validate_and_parse_date(date_value)
-        super().__init__(date_obj)
+        super().__init__(date_value)
 
     def __str__(self):
-        return format_date_str(self.value)
+        return self._formatted
 
     def to_dict(self) -> str | None:
         """
@@ -47,19 +49,19 @@ class Birthday(Field):
         """
         return self.value.isoformat() if self.value else None
 
-    @Field.value.setter
-    def value(self, date_value: str | date):
+    def __setattr__(self, name: str, value: any) -> None:
         """
-        Sets a new validated birthday date value.
+        Validates a new birthday date value on assignment.
 
         Raises:
             TypeError: If date value is not one of incorrect types.
             ValidationError: If bad date format is provided.
-
-        Overrides setter from parent adding validation.
         """
-        date_obj = self._validate_and_parse_date(date_value)
-        self._value = date_obj
+        if name == "value":
+            value = self._validate_and_parse_date(value)
+            super().__setattr__("month_day", (value.month, value.day))
+            super().__setattr__("_formatted", format_date_str(value))
+        super().__setattr__(name, value)
 
     def _validate_and_parse_date(self, date_value: str | date) -> date:
         validate_argument_type(date_value, (str, date))
@@ -84,6 +86,7 @@ if __name__ == "__main__":
     test_birthday_1 = Birthday(TEST_DATE_STR_VALID)
     assert isinstance(test_birthday_1.value, date)
     assert format_date_str(test_birthday_1.value) == TEST_DATE_STR_VALID
+    assert test_birthday_1.month_day == (3, 2)
 
     # Test str and repr
     assert str(test_birthday_1) == TEST_DATE_STR_VALID
@@ -155,5 +158,7 @@ if __name__ == "__main__":
     test_birthday_7.value = test_date_obj_in_the_future
     assert isinstance(test_birthday_7.value, date)
     assert format_date_str(test_birthday_7.value) == TEST_DATE_STR_IN_THE_FUTURE
+    assert test_birthday_7.month_day == (1, 1)
+    assert str(test_birthday_7) == TEST_DATE_STR_IN_THE_FUTURE
 
     print("Birthday tests passed.")
@@ -5,10 +5,9 @@ This module defines the base `Field` class used for contact fields.
 It provides basic storage and string conversion behavior.
 """
 
-from dataclasses import dataclass
+from typing import Callable
 
 
-@dataclass(repr=False)
 class Field:
     """
     Base class for contact record fields.
@@ -17,9 +16,30 @@ class Field:
 
     Provides common functionality including: __str__(), __repr__(), to_dict().
     Instances of Field are compared (__eq__) based on their stored value.
+
+    Fields declare __slots__ to avoid per-instance __dict__, as an address book
+    holds many small field objects. The value is a plain slot attribute, so reads
+    are direct; subclasses validate assignments by overriding __setattr__.
+    Change callbacks, if any, are invoked after every value assignment. They are
+    kept in a tuple, empty by default, so fields without callbacks allocate none.
     """
 
-    _value: any
+    __slots__ = ("value", "_change_callbacks")
+
+    def __init__(self, value: any):
+        self._change_callbacks: tuple[Callable[[], None], ...] = ()
+        self.value = value
+
+    def __setattr__(self, name: str, value: any) -> None:
+        super().__setattr__(name, value)
+        if name == "value":
+            for callback in self._change_callbacks:
+                callback()
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return self.value == other.value
+        return NotImplemented
 
     def __str__(self):
         return str(self.value)
@@ -36,23 +56,19 @@ class Field:
         """
         return str(self.value)
 
-    @property
-    def value(self) -> any:
+    def add_change_callback(self, callback: Callable[[], None]) -> None:
         """
-        Retrieves the stored value of the field.
-
-        This property provides read access to the internal `_value` attribute,
-        which represents the field's content. It is used by subclasses to access
-        or override the behavior of getting a field's value.
+        Registers a callback invoked after the field value changes.
 
-        Returns:
-            Any: The current value stored in the field.
+        Used by the owning records to keep dependent data in sync.
         """
-        return self._value
+        self._change_callbacks += (callback,)
 
-    @value.setter
-    def value(self, value: any) -> None:
-        self._value = value
+    def remove_change_callback(self, callback: Callable[[], None]) -> None:
+        """Unregisters a callback previously added with add_change_callback."""
+        callbacks = list(self._change_callbacks)
+        callbacks.remove(callback)
+        self._change_callbacks = tuple(callbacks)
 
 
 if __name__ == "__main__":
@@ -68,6 +84,7 @@ if __name__ == "__main__":
     assert (
         repr(test_field_of_str) == "Field(value='some_value')"
     )  # __repr__ override test
+    assert not hasattr(test_field_of_str, "__dict__")  # __slots__ test
 
     test_field_of_int = Field(TEST_VALUE_DATE)
     assert isinstance(test_field_of_int.value, int)
@@ -75,4 +92,18 @@ if __name__ == "__main__":
     assert test_field_of_int == Field(TEST_VALUE_DATE)  # __eq__ override test
     assert repr(test_field_of_int) == "Field(value=42)"  # __repr__ override test
 
+    # Test change callbacks are called on value update until removed
+    test_field_changes = []
+
+    def test_field_callback() -> None:
+        test_field_changes.append(True)
+
+    assert test_field_of_int._change_callbacks == ()  # shared empty default
+    test_field_of_int.add_change_callback(test_field_callback)
+    test_field_of_int.value = TEST_VALUE_DATE + 1
+    assert test_field_changes == [True]
+    test_field_of_int.remove_change_callback(test_field_callback)
+    test_field_of_int.value = TEST_VALUE_DATE
+    assert test_field_changes == [True]
+
     print("Field tests passed.")
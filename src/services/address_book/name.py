@@ -5,10 +5,13 @@ This module defines the `Name` class which extends `Field` and ensures
 the contact name is valid on assignment.
 """
 
+import sys
+from typing import Callable
+
 from services.address_book.field import Field
 
 from validators.errors import ValidationError
-from validators.field_validators import validate_username_length
+from validators.field_validators import validate_stripped_username_length
 
 
 class Name(Field):
@@ -16,23 +19,44 @@ class Name(Field):
     Class for storing and validating contact names.
 
     Ensures the name is validated on initialization and value changes.
+
+    Attributes:
+        casefolded (str): Case-folded name, cached for case-insensitive search.
     """
 
+    __slots__ = ("casefolded", "_validate_change")
+
     def __init__(self, username: str):
-        username = username.strip()
-        validate_username_length(username)
+        self._validate_change: Callable[["Name", str], None] | None = None
         super().__init__(username)
 
-    @Field.value.setter
-    def value(self, username: str):
+    def __setattr__(self, name: str, value: any) -> None:
+        """
+        Validates a new name value on assignment.
+
+        The name is interned, as it is used as the address book key.
+        Keeps the cached case-folded name in sync with the value.
+        The change validator, if any, may reject the new value before it is set.
+        """
+        if name == "value":
+            value = sys.intern(value.strip())
+            validate_stripped_username_length(value)
+            if self._validate_change:
+                self._validate_change(self, value)
+            super().__setattr__("casefolded", value.casefold())
+        super().__setattr__(name, value)
+
+    def set_change_validator(
+        self, validator: Callable[["Name", str], None] | None
+    ) -> None:
         """
-        Sets a new validated name value.
+        Registers a validator called with the name and the new username
+        before the value changes. It may raise ValidationError to reject it.
 
-        Overrides setter from parent adding validation.
+        Used by the owning record to reject renames its address books can't follow.
+        Pass None to detach the validator.
         """
-        username = username.strip()
-        validate_username_length(username)
-        self._value = username
+        self._validate_change = validator
 
 
 if __name__ == "__main__":
@@ -94,4 +118,23 @@ if __name__ == "__main__":
         )
     assert test_name.value == TEST_USERNAME_VALID
 
+    # Test cached case-folded name is kept in sync with the value
+    assert test_name.casefolded == "alice"
+    test_name.value = "Bob"
+    assert test_name.casefolded == "bob"
+
+    # Test change validator rejects a new value before it is set
+    def reject_change(name: Name, username: str) -> None:
+        raise ValidationError(f"Rejected '{username}' for '{name}'")
+
+    test_name.set_change_validator(reject_change)
+    try:
+        test_name.value = "Carl"
+    except ValidationError as exc:
+        assert str(exc) == "Rejected 'Carl' for 'Bob'"
+    else:
+        assert False, "Should raise Validation error when change validator rejects"
+    assert test_name.value == "Bob"
+    assert test_name.casefolded == "bob"
+
     print("Name tests passed.")
@@ -5,10 +5,21 @@ This module defines the `Phone` class which extends `Field` and ensures
 the phone number is valid on assignment or update.
 """
 
+import sys
+from functools import lru_cache
+from typing import Callable
+
 from services.address_book.field import Field
 
+from utils.constants import PHONE_VALIDATION_CACHE_SIZE
 from validators.errors import ValidationError
-from validators.field_validators import validate_phone_number
+from validators.field_validators import validate_stripped_phone_number
+
+# Valid phone numbers are remembered, so repeated numbers are validated once.
+# Invalid ones raise and are never cached.
+_validate_phone_number_cached = lru_cache(maxsize=PHONE_VALIDATION_CACHE_SIZE)(
+    validate_stripped_phone_number
+)
 
 
 class Phone(Field):
@@ -19,26 +30,45 @@ class Phone(Field):
     value changes.
     """
 
+    __slots__ = ("_validate_change",)
+
     def __init__(self, phone_number: str):
-        phone_number = phone_number.strip()
-        validate_phone_number(phone_number)
+        self._validate_change: Callable[["Phone", str], None] | None = None
         super().__init__(phone_number)
 
-    @Field.value.setter
-    def value(self, phone_number: str):
+    def __setattr__(self, name: str, value: any) -> None:
         """
-        Sets a new validated phone number value.
+        Validates a new phone number value on assignment.
 
-        Overrides setter from parent adding validation.
+        The phone number is interned, as it is used as the record phone index key.
+        The change validator, if any, may reject the new value before it is set.
         """
-        phone_number = phone_number.strip()
-        validate_phone_number(phone_number)
-        self._value = phone_number
+        if name != "value":
+            super().__setattr__(name, value)
+            return
+
+        value = sys.intern(value.strip())
+        _validate_phone_number_cached(value)
+        if self._validate_change:
+            self._validate_change(self, value)
+        super().__setattr__(name, value)
 
     def update_phone(self, phone_number: str):
         """Updated phone number with a new one."""
         self.value = phone_number
 
+    def set_change_validator(
+        self, validator: Callable[["Phone", str], None] | None
+    ) -> None:
+        """
+        Registers a validator called with the phone and the new phone number
+        before the value changes. It may raise ValidationError to reject it.
+
+        Used by the owning record to keep its phones consistent.
+        Pass None to detach the validator.
+        """
+        self._validate_change = validator
+
 
 if __name__ == "__main__":
     # TESTS
@@ -111,4 +141,35 @@ if __name__ == "__main__":
             "when updating Phone instance with invalid phone number value"
         )
 
+    # Test change callback is called on value update
+    test_phone_changes = []
+    test_phone_6 = Phone(TEST_VALID_PHONE_NUMBER_1)
+
+    def test_phone_callback() -> None:
+        test_phone_changes.append(True)
+
+    test_phone_6.add_change_callback(test_phone_callback)
+    test_phone_6.update_phone(TEST_VALID_PHONE_NUMBER_2)
+    assert len(test_phone_changes) == 1
+    test_phone_6.remove_change_callback(test_phone_callback)
+    test_phone_6.update_phone(TEST_VALID_PHONE_NUMBER_1)
+    assert len(test_phone_changes) == 1
+
+    # Test change validator rejects a new value before it is set
+    def reject_change(phone: Phone, phone_number: str) -> None:
+        raise ValidationError(f"Rejected '{phone_number}' for '{phone}'")
+
+    test_phone_6.add_change_callback(test_phone_callback)
+    test_phone_6.set_change_validator(reject_change)
+    try:
+        test_phone_6.update_phone(TEST_VALID_PHONE_NUMBER_2)
+    except ValidationError as exc:
+        assert str(exc) == (
+            f"Rejected '{TEST_VALID_PHONE_NUMBER_2}' for '{TEST_VALID_PHONE_NUMBER_1}'"
+        )
+    else:
+        assert False, "Should raise Validation error when change validator rejects"
+    assert test_phone_6.value == TEST_VALID_PHONE_NUMBER_1
+    assert len(test_phone_changes) == 1
+
     print("Phone tests passed.")
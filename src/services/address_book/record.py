@@ -2,10 +2,13 @@
 This module defines the Record class for managing a contact's name,
 phone numbers, and birthday.
 """
+from typing import Callable
+
 from services.address_book.birthday import Birthday
 from services.address_book.name import Name
 from services.address_book.phone import Phone
 
+from utils.constants import PHONES_BLOB_SEPARATOR
 from validators.errors import ValidationError
 from validators.contact_validators import (
     ensure_phone_not_in_contact,
@@ -25,8 +28,12 @@ class Record:
 
     Attributes:
         name (Name): The contact's name (required).
-        phones (list[Phone]): A list of phones associated with the contact.
+        phones (dict[str, Phone]): Phones associated with the contact, keyed by
+                                   phone number, in the order they were added.
         birthday (Birthday | None): The contact's birthday if set.
+        phones_blob (bytes): Case-folded phones joined into a single byte string,
+                             cached for substring search across all phones at once.
+        phones_str (str): Phones joined for display, cached until phones change.
 
     Methods:
         - add_phone(phone_number): Adds a new phone.
@@ -35,26 +42,54 @@ class Record:
         - remove_phone(phone_number): Removes a phone.
         - add_birthday(date): Adds or updates birthday.
         - to_dict(): Returns the record as a dictionary.
+        - add_phones_observer(observer): Subscribes to phone numbers changes.
+        - remove_phones_observer(observer): Unsubscribes from phone numbers changes.
+        - add_birthday_observer(observer): Subscribes to birthday changes.
+        - remove_birthday_observer(observer): Unsubscribes from birthday changes.
+        - add_name_validator(validator): Subscribes to validate name changes.
+        - remove_name_validator(validator): Unsubscribes from name changes validation.
     """
 
+    __slots__ = (
+        "_name",
+        "_birthday",
+        "phones",
+        "phones_blob",
+        "_phones_str",
+        "_str_cache",
+        "_phones_observers",
+        "_birthday_observers",
+        "_name_validators",
+    )
+
     def __init__(self, username: str):
-        self.name: Name = Name(username)
-        self.birthday: Birthday | None = None
-        self.phones: list[Phone] = []
+        self._phones_observers: list[Callable[["Record"], None]] = []
+        self._birthday_observers: list[Callable[["Record"], None]] = []
+        self._name_validators: list[Callable[["Record", str], None]] = []
+        self._name: Name | None = None
+        self._birthday: Birthday | None = None
+        self.name = Name(username)
+        self.phones: dict[str, Phone] = {}
+        self.phones_blob: bytes = b""
+        self._phones_str: str | None = ""
+        self._str_cache: str | None = None
 
     def __str__(self):
-        name_info = f"{self.name}"
-        birthday_optional_info = f"birthday: {self.birthday}, " if self.birthday else ""
-        phones_info = (
-            f"phones: {'; '.join(phone.value for phone in self.phones) or 'none'}"
-        )
-        return f"{name_info} : {birthday_optional_info}{phones_info}"
+        # Built once and reused until name, phones or birthday change
+        if self._str_cache is None:
+            name_info = f"{self.name}"
+            birthday_optional_info = (
+                f"birthday: {self.birthday}, " if self.birthday else ""
+            )
+            phones_info = f"phones: {self.phones_str or 'none'}"
+            self._str_cache = f"{name_info} : {birthday_optional_info}{phones_info}"
+        return self._str_cache
 
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(name={repr(self.name)}"
             f", birthday={repr(self.birthday)}"
-            f", phones={repr(self.phones)})"
+            f", phones={repr(list(self.phones.values()))})"
         )
 
     def __eq__(self, other):
@@ -68,11 +103,51 @@ class Record:
 
     def __contains__(self, item):
         if isinstance(item, Phone):
-            return item in self.phones
+            return self.phones.get(item.value) == item
         if isinstance(item, Birthday):
             return self.birthday == item
         return False
 
+    @property
+    def name(self) -> Name:
+        """The contact's name."""
+        return self._name
+
+    @name.setter
+    def name(self, name: Name) -> None:
+        # Both assigning a new name and changing the name value are validated
+        if self._name is not None:
+            self._validate_name_update(self._name, name.value)
+            self._name.remove_change_callback(self._on_name_updated)
+            self._name.set_change_validator(None)
+        self._name = name
+        name.add_change_callback(self._on_name_updated)
+        name.set_change_validator(self._validate_name_update)
+        self._on_name_updated()
+
+    @property
+    def birthday(self) -> Birthday | None:
+        """The contact's birthday if set."""
+        return self._birthday
+
+    @birthday.setter
+    def birthday(self, birthday: Birthday | None) -> None:
+        # Every assignment is seen by the observers, not only add_birthday(),
+        # and so are changes of the birthday value
+        if self._birthday is not None:
+            self._birthday.remove_change_callback(self._on_birthday_updated)
+        self._birthday = birthday
+        if birthday is not None:
+            birthday.add_change_callback(self._on_birthday_updated)
+        self._on_birthday_updated()
+
+    @property
+    def phones_str(self) -> str:
+        """Phone numbers joined for display, computed once per phones change."""
+        if self._phones_str is None:
+            self._phones_str = "; ".join(self.phones)
+        return self._phones_str
+
     def to_dict(self) -> dict:
         """
         Return a dictionary representation of the contact record.
@@ -82,7 +157,7 @@ class Record:
         """
         return {
             "name": self.name.to_dict(),
-            "phones": [phone.to_dict() for phone in self.phones],
+            "phones": list(self.phones),
             "birthday": self.birthday.to_dict() if self.birthday else None,
         }
 
@@ -95,7 +170,10 @@ class Record:
         """
         ensure_phone_not_in_contact(phone_number, self)
         new_phone = Phone(phone_number)
-        self.phones.append(new_phone)
+        new_phone.add_change_callback(self._on_phone_updated)
+        new_phone.set_change_validator(self._validate_phone_update)
+        self.phones[new_phone.value] = new_phone
+        self._notify_phones_changed()
 
     def find_phone(self, phone_number: str) -> Phone:
         """
@@ -107,19 +185,21 @@ class Record:
         Raises:
             ValidationError: If the phone is not found in the record.
         """
-        _, phone = ensure_phone_is_in_contact(phone_number, self)
+        phone = ensure_phone_is_in_contact(phone_number, self)
         return phone if phone else None
 
     def edit_phone(self, prev_phone_number: str, new_phone_number: str) -> None:
         """
         Updates an existing phone with a new phone number.
 
+        The new phone number is checked for duplicates by the phone's change
+        validator, the same way as for direct phone updates.
+
         Raises:
-            ValidationError: If the new phone number already exists
-            or if the old phone number is not found.
+            ValidationError: If the old phone number is not found
+            or if the new phone number already exists.
         """
-        ensure_phone_not_in_contact(new_phone_number, self)
-        _, phone = ensure_phone_is_in_contact(prev_phone_number, self)
+        phone = ensure_phone_is_in_contact(prev_phone_number, self)
         phone.update_phone(new_phone_number)
 
     def remove_phone(self, phone_number: str) -> None:
@@ -129,8 +209,11 @@ class Record:
         Raises:
             ValidationError: If the phone number does not exist.
         """
-        idx, _ = ensure_phone_is_in_contact(phone_number, self)
-        self.phones.pop(idx)
+        removed_phone = ensure_phone_is_in_contact(phone_number, self)
+        del self.phones[phone_number]
+        removed_phone.remove_change_callback(self._on_phone_updated)
+        removed_phone.set_change_validator(None)
+        self._notify_phones_changed()
 
     def add_birthday(self, date: str) -> None:
         """
@@ -156,6 +239,73 @@ class Record:
         # Update (replace) existing birthday
         self.birthday = new_birthday
 
+    def add_phones_observer(self, observer: Callable[["Record"], None]) -> None:
+        """
+        Registers an observer called with the record whenever its phone numbers change.
+
+        Phone numbers change when a phone is added, removed or edited (including
+        direct updates of a phone object belonging to the record).
+        A record may have several observers, e.g. when it is kept in several books.
+        """
+        self._phones_observers.append(observer)
+
+    def remove_phones_observer(self, observer: Callable[["Record"], None]) -> None:
+        """Unregisters an observer previously added with add_phones_observer."""
+        self._phones_observers.remove(observer)
+
+    def add_birthday_observer(self, observer: Callable[["Record"], None]) -> None:
+        """
+        Registers an observer called with the record whenever its birthday is set,
+        either with add_birthday() or by assigning the birthday attribute.
+        """
+        self._birthday_observers.append(observer)
+
+    def remove_birthday_observer(self, observer: Callable[["Record"], None]) -> None:
+        """Unregisters an observer previously added with add_birthday_observer."""
+        self._birthday_observers.remove(observer)
+
+    def add_name_validator(self, validator: Callable[["Record", str], None]) -> None:
+        """
+        Registers a validator called with the record and the new username before
+        its name is set, either by assigning the name attribute or by changing
+        the name value. It may raise ValidationError to reject the change.
+        """
+        self._name_validators.append(validator)
+
+    def remove_name_validator(self, validator: Callable[["Record", str], None]) -> None:
+        """Unregisters a validator previously added with add_name_validator."""
+        self._name_validators.remove(validator)
+
+    def _validate_name_update(self, name: Name, username: str) -> None:
+        for validator in self._name_validators:
+            validator(self, username)
+
+    def _on_name_updated(self) -> None:
+        self._str_cache = None
+
+    def _on_birthday_updated(self) -> None:
+        self._str_cache = None
+        for observer in self._birthday_observers:
+            observer(self)
+
+    def _validate_phone_update(self, phone: Phone, phone_number: str) -> None:
+        # Reject a number the record already has, as re-keying would drop a phone
+        ensure_phone_not_in_contact(phone_number, self)
+
+    def _on_phone_updated(self) -> None:
+        # Re-key phones by their current numbers, keeping the phones order
+        self.phones = {phone.value: phone for phone in self.phones.values()}
+        self._notify_phones_changed()
+
+    def _notify_phones_changed(self) -> None:
+        self._phones_str = None
+        self._str_cache = None
+        self.phones_blob = PHONES_BLOB_SEPARATOR.join(
+            phone_number.casefold().encode() for phone_number in self.phones
+        )
+        for observer in self._phones_observers:
+            observer(self)
+
 
 if __name__ == "__main__":
     # TESTS
@@ -284,7 +434,7 @@ if __name__ == "__main__":
     assert len(test_record_remove.phones) == 2
     test_record_remove.remove_phone(TEST_REMOVE_PHONE_NUMBER_1)
     assert len(test_record_remove.phones) == 1
-    assert test_record_remove.phones[0].value == TEST_REMOVE_PHONE_NUMBER_2
+    assert list(test_record_remove.phones) == [TEST_REMOVE_PHONE_NUMBER_2]
 
     try:
         test_record_remove.remove_phone(TEST_REMOVE_PHONE_NUMBER_UNKNOWN)
@@ -312,6 +462,9 @@ if __name__ == "__main__":
 
     test_record_birthday.add_birthday(TEST_BIRTHDAY_DATE_STR)
     assert test_birthday in test_record_birthday
+    assert str(test_record_birthday) == (
+        f"{TEST_BIRTHDAY_USERNAME} : birthday: {TEST_BIRTHDAY_DATE_STR}, phones: none"
+    )
 
     try:
         test_record_birthday.add_birthday(TEST_BIRTHDAY_DATE_STR)
@@ -329,5 +482,154 @@ if __name__ == "__main__":
 
     test_record_birthday.add_birthday(TEST_BIRTHDAY_DATE_STR_UPDATE)
     assert test_birthday_updated in test_record_birthday
+    test_record_birthday.add_phone("1234567890")
+    assert str(test_record_birthday) == (
+        f"{TEST_BIRTHDAY_USERNAME} : birthday: {TEST_BIRTHDAY_DATE_STR_UPDATE}, "
+        "phones: 1234567890"
+    )
+
+    # Test phones observer is notified on phone changes
+    test_observed_changes = []
+    test_record_observed = Record("Observed")
+    test_observed_changes_other = []
+    test_record_observed.add_phones_observer(test_observed_changes.append)
+    test_record_observed.add_phones_observer(test_observed_changes_other.append)
+    test_record_observed.add_phone("1111111111")
+    test_record_observed.edit_phone("1111111111", "2222222222")
+    test_record_observed.find_phone("2222222222").update_phone("3333333333")
+    test_record_observed.remove_phone("3333333333")
+    assert test_observed_changes == [test_record_observed] * 4
+    assert test_observed_changes_other == [test_record_observed] * 4
+
+    # Test removed phones observer is no longer notified, other observers still are
+    test_record_observed.remove_phones_observer(test_observed_changes_other.append)
+    test_record_observed.add_phone("4444444444")
+    assert test_observed_changes == [test_record_observed] * 5
+    assert test_observed_changes_other == [test_record_observed] * 4
+    test_record_observed.remove_phone("4444444444")
+
+    # Test birthday observer is notified on birthday changes
+    test_observed_birthdays = []
+    test_record_observed.add_birthday_observer(test_observed_birthdays.append)
+    test_record_observed.add_birthday("01.01.2000")
+    test_record_observed.add_birthday("02.01.2000")
+    assert test_observed_birthdays == [test_record_observed] * 2
+
+    # Test birthday observer is notified on direct birthday assignment
+    test_record_observed.birthday = Birthday("03.01.2000")
+    assert test_observed_birthdays == [test_record_observed] * 3
+    assert str(test_record_observed) == "Observed : birthday: 03.01.2000, phones: none"
+    test_record_observed.birthday = None
+    assert test_observed_birthdays == [test_record_observed] * 4
+    assert str(test_record_observed) == "Observed : phones: none"
+    test_record_observed.remove_birthday_observer(test_observed_birthdays.append)
+    test_record_observed.add_birthday("01.01.2000")
+    assert test_observed_birthdays == [test_record_observed] * 4
+
+    # Test birthday changed in place is observed, name changes are validated
+    test_validated_names = []
+
+    def test_name_validator(record: Record, username: str) -> None:
+        test_validated_names.append(username)
+
+    test_record_observed.add_birthday_observer(test_observed_birthdays.append)
+    test_record_observed.add_name_validator(test_name_validator)
+    test_record_observed.birthday.value = "05.01.2000"
+    assert test_observed_birthdays == [test_record_observed] * 5
+    assert str(test_record_observed) == "Observed : birthday: 05.01.2000, phones: none"
+    test_record_observed.name.value = "Renamed"
+    assert test_validated_names == ["Renamed"]
+    assert str(test_record_observed) == "Renamed : birthday: 05.01.2000, phones: none"
+
+    # Test replaced name and birthday objects are no longer observed
+    test_replaced_name = test_record_observed.name
+    test_replaced_birthday = test_record_observed.birthday
+    test_record_observed.name = Name("Observed")
+    test_record_observed.birthday = None
+    assert test_validated_names == ["Renamed", "Observed"]
+    assert test_observed_birthdays == [test_record_observed] * 6
+    test_replaced_name.value = "Detached"
+    test_replaced_birthday.value = "06.01.2000"
+    assert test_validated_names == ["Renamed", "Observed"]
+    assert test_observed_birthdays == [test_record_observed] * 6
+    assert str(test_record_observed) == "Observed : phones: none"
+
+    # Test name validator rejects a rename before the name changes
+    def test_reject_rename(record: Record, username: str) -> None:
+        raise ValidationError(f"Rejected '{username}' for '{record.name}'")
+
+    test_record_observed.remove_name_validator(test_name_validator)
+    test_record_observed.add_name_validator(test_reject_rename)
+    try:
+        test_record_observed.name.value = "Renamed"
+    except ValidationError as exc:
+        assert str(exc) == "Rejected 'Renamed' for 'Observed'"
+    else:
+        assert False, "Should raise Validation error when name validator rejects"
+    try:
+        test_record_observed.name = Name("Renamed")
+    except ValidationError as exc:
+        assert str(exc) == "Rejected 'Renamed' for 'Observed'"
+    else:
+        assert False, "Should raise Validation error when name validator rejects"
+    assert test_record_observed.name.value == "Observed"
+    assert str(test_record_observed) == "Observed : phones: none"
+    test_record_observed.remove_name_validator(test_reject_rename)
+
+    # Test phones blob is kept in sync with phones
+    test_record_blob = Record("Blob")
+    assert test_record_blob.phones_blob == b""
+    test_record_blob.add_phone("1111111111")
+    test_record_blob.add_phone("2222222222")
+    assert test_record_blob.phones_blob == b"1111111111\x1f2222222222"
+    test_record_blob.find_phone("1111111111").update_phone("3333333333")
+    assert test_record_blob.phones_blob == b"3333333333\x1f2222222222"
+    test_record_blob.remove_phone("2222222222")
+    assert test_record_blob.phones_blob == b"3333333333"
+
+    # Test phones are keyed by their current numbers, keeping phones order
+    test_record_numbers = Record("Numbers")
+    assert test_record_numbers.phones == {}
+    test_record_numbers.add_phone("1111111111")
+    test_record_numbers.add_phone("2222222222")
+    test_record_numbers.add_phone("3333333333")
+    assert list(test_record_numbers.phones) == [
+        "1111111111",
+        "2222222222",
+        "3333333333",
+    ]
+    test_record_numbers.phones["1111111111"].value = "4444444444"
+    assert list(test_record_numbers.phones) == [
+        "4444444444",
+        "2222222222",
+        "3333333333",
+    ]
+    assert test_record_numbers.phones["4444444444"].value == "4444444444"
+    test_record_numbers.remove_phone("2222222222")
+    assert list(test_record_numbers.phones) == ["4444444444", "3333333333"]
+    assert Phone("4444444444") in test_record_numbers
+    assert Phone("2222222222") not in test_record_numbers
+
+    # Test updating a phone directly to a number the record already has is rejected
+    try:
+        test_record_numbers.find_phone("4444444444").update_phone("3333333333")
+    except ValidationError as exc:
+        assert str(exc) == "Contact 'Numbers' has '3333333333' phone number already."
+    else:
+        assert False, "Should raise Validation error when updating to existing phone"
+    assert list(test_record_numbers.phones) == ["4444444444", "3333333333"]
+    assert test_record_numbers.phones["4444444444"].value == "4444444444"
+
+    # Test display phones string is cached and refreshed on phones change
+    test_record_phones_str = Record("Cache")
+    assert test_record_phones_str.phones_str == ""
+    test_record_phones_str.add_phone("1111111111")
+    test_record_phones_str.add_phone("2222222222")
+    assert test_record_phones_str.phones_str == "1111111111; 2222222222"
+    assert test_record_phones_str.phones_str is test_record_phones_str.phones_str
+    test_record_phones_str.find_phone("1111111111").update_phone("3333333333")
+    assert str(test_record_phones_str) == "Cache : phones: 3333333333; 2222222222"
+    test_record_phones_str.remove_phone("3333333333")
+    assert test_record_phones_str.phones_str == "2222222222"
 
     print("Record tests passed.")
@@ -27,6 +27,7 @@ from utils.constants import (
     MSG_PHONE_UPDATED,
     MSG_PHONE_DELETED,
     MSG_SHOW_NO_MATCHES,
+    MSG_SHOW_FOUND_ONE_MATCH,
     MSG_SHOW_FOUND_MATCHES,
     MSG_BIRTHDAY_ADDED,
     MSG_BIRTHDAY_UPDATED,
@@ -37,6 +38,10 @@ from utils.constants import (
 )
 from validators.contact_validators import ensure_contacts_storage_not_empty
 
+# Composite result messages, built once
+_MSG_CONTACT_UPDATED_PHONE_ADDED = f"{MSG_CONTACT_UPDATED} {MSG_PHONE_ADDED}"
+_MSG_CONTACT_UPDATED_PHONE_DELETED = f"{MSG_CONTACT_UPDATED} {MSG_PHONE_DELETED}"
+
 
 @service_error
 def show_all(book: AddressBook) -> dict[str, str | list[dict[str, str]]]:
@@ -75,7 +80,7 @@ def add_contact(username: str, phone_number: str, book: AddressBook) -> dict[str
     if contact:
         contact.add_phone(phone_number)
         return {
-            "message": f"{MSG_CONTACT_UPDATED} {MSG_PHONE_ADDED}",
+            "message": _MSG_CONTACT_UPDATED_PHONE_ADDED,
         }
 
     contact = Record(username)
@@ -157,17 +162,16 @@ def show_phone(search_term: str, book: AddressBook) -> dict[str, str | list[dict
             "message": MSG_SHOW_NO_MATCHES,
         }
 
-    # Sort found matches alphabetically by name
-    matches.sort(key=lambda record: record.name.value.casefold())
-
     # Form return dictionary object
     count = len(matches)
-    suffix = "" if count == 1 else "es"
-    search_prompt = f"{search_term}" if search_term else "empty search"
-    message = f"{MSG_SHOW_FOUND_MATCHES.format(count, suffix)} for '{search_prompt}'"
+    if count == 1:
+        found = MSG_SHOW_FOUND_ONE_MATCH
+    else:
+        found = MSG_SHOW_FOUND_MATCHES.format(count)
+    search_prompt = search_term if search_term else "empty search"
+    message = f"{found} for '{search_prompt}'"
     items = [
-        {"name": record.name.value, "phones": [phone.value for phone in record.phones]}
-        for record in matches
+        {"name": record.name.value, "phones": list(record.phones)} for record in matches
     ]
 
     return {
@@ -195,7 +199,7 @@ def remove_phone(username: str, phone_number: str, book: AddressBook) -> dict[st
     contact.remove_phone(phone_number)
 
     return {
-        "message": f"{MSG_CONTACT_UPDATED} {MSG_PHONE_DELETED}",
+        "message": _MSG_CONTACT_UPDATED_PHONE_DELETED,
     }
 
 
@@ -45,18 +45,38 @@ DEFAULT_LINE_OFFSET = " " * 2
 LINE_VALUE_GROUP_SEPARATION_SYMBOL = ":"
 LINE_VALUE_LIST_SEPARATION_SYMBOL = ","
 
+# === Search Index ===
+
+# Length of the n-grams used by the address book search index.
+# Bigrams let two-symbol terms use the index as well,
+# single symbol terms fall back to a full scan.
+SEARCH_NGRAM_LENGTH = 2
+# Separator of phone numbers joined into a single byte string for search
+PHONES_BLOB_SEPARATOR = b"\x1f"
+# Max number of search terms with remembered matches (least recently used are
+# forgotten first), until the book changes
+SEARCH_MATCH_CACHE_SIZE = 128
+# Separator of records joined into a single byte string for a full scan
+SEARCH_RECORDS_SEPARATOR = b"\x1e"
+# Max number of valid phone numbers remembered, so each is validated once
+PHONE_VALIDATION_CACHE_SIZE = 4096
+
 # === Validator Messages ===
 
 MSG_CONTACT_EXISTS = "Contact with username '{0}' already exists"
 MSG_NO_CONTACTS = "You don't have contacts yet, but you can add one anytime."
 MSG_CONTACT_NOT_FOUND = "Contact '{0}' not found"
+MSG_CONTACT_RENAME_IN_BOOK = (
+    "Contact '{0}' is in the address book and can't be renamed to '{1}'."
+)
 MSG_PHONE_NUMBER_EXISTS = "Contact '{0}' has '{1}' phone number already."
 MSG_PHONE_NUMBER_NOT_FOUND = "Phone number '{0}' for contact '{1}' not found."
 MSG_BIRTHDAY_DUPLICATE = "Birthday for '{0}' is already set to '{1}'."
 
 # === Contact Manager Messages and Feedback ===
 
-MSG_HAVE_CONTACTS = "You have {0} contact{1}"
+MSG_HAVE_ONE_CONTACT = "You have 1 contact"
+MSG_HAVE_CONTACTS = "You have {0} contacts"
 MSG_CONTACT_ADDED = "Contact added."
 MSG_CONTACT_UPDATED = "Contact updated."
 MSG_CONTACT_DELETED = "Contact deleted."
@@ -64,7 +84,8 @@ MSG_PHONE_ADDED = "Phone added."
 MSG_PHONE_UPDATED = "Phone updated."
 MSG_PHONE_DELETED = "Phone deleted."
 MSG_SHOW_NO_MATCHES = "No matches found."
-MSG_SHOW_FOUND_MATCHES = "Found {0} match{1}"
+MSG_SHOW_FOUND_ONE_MATCH = "Found 1 match"
+MSG_SHOW_FOUND_MATCHES = "Found {0} matches"
 
 MSG_BIRTHDAY_ADDED = "Birthday added."
 MSG_BIRTHDAY_UPDATED = "Birthday updated."
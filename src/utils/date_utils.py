@@ -8,14 +8,27 @@ from datetime import datetime, date
 
 from utils.constants import DATE_FORMAT
 
+# Whether dates can be parsed by fixed slices instead of strptime
+_IS_DOTTED_DAY_MONTH_YEAR_FORMAT = DATE_FORMAT == "%d.%m.%Y"
+
 
 def is_leap_year(year: int) -> bool:
     """Determines whether a given year is a leap year."""
-    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    # For multiples of 4, divisibility by 100 and 400 is the same as by 25 and 16
+    return not year & 3 and (year % 25 != 0 or not year & 15)
 
 
 def parse_date(date_str: str) -> date:
     """Parses a date string into a `datetime.date` object."""
+    # Fast path for the fixed DD.MM.YYYY shape, strptime handles other inputs
+    if (
+        _IS_DOTTED_DAY_MONTH_YEAR_FORMAT
+        and len(date_str) == 10
+        and date_str[2] == date_str[5] == "."
+        and date_str.isascii()
+        and (date_str[:2] + date_str[3:5] + date_str[6:]).isdigit()
+    ):
+        return date(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
     return datetime.strptime(date_str, DATE_FORMAT).date()
 
 
@@ -28,7 +41,24 @@ if __name__ == "__main__":
     assert is_leap_year(2000) is True
     assert is_leap_year(2004) is True
     assert is_leap_year(2001) is False
+    assert is_leap_year(1900) is False
+    assert is_leap_year(2100) is False
+    assert is_leap_year(2400) is True
+    assert all(
+        is_leap_year(year) == (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0))
+        for year in range(1, 3000)
+    )
 
     assert (format_date_str(date(2000, 1, 1))) == "01.01.2000"
 
+    assert parse_date("29.02.2000") == date(2000, 2, 29)
+    assert parse_date("1.2.2000") == date(2000, 2, 1)  # parsed by strptime
+    for invalid_date_str in ("29.02.2001", "01.13.2000", "01-01-2000", "+1.01.2000"):
+        try:
+            parse_date(invalid_date_str)
+        except ValueError:
+            pass
+        else:
+            assert False, f"Should raise ValueError for '{invalid_date_str}'"
+
     print("Date Utils tests passed.")
@@ -10,11 +10,19 @@ from utils.constants import (
     DEFAULT_LINE_OFFSET,
     LINE_VALUE_GROUP_SEPARATION_SYMBOL,
     LINE_VALUE_LIST_SEPARATION_SYMBOL,
+    MSG_HAVE_ONE_CONTACT,
     MSG_HAVE_CONTACTS,
     MSG_BIRTHDAY_MOVED,
+    SEARCH_NGRAM_LENGTH,
 )
 from utils.date_utils import format_date_str
 
+# Separators between value groups and between list values of an output line
+_VALUE_GROUP_SEPARATOR = f" {LINE_VALUE_GROUP_SEPARATION_SYMBOL} "
+_VALUE_LIST_SEPARATOR = f"{LINE_VALUE_LIST_SEPARATION_SYMBOL} "
+# Blank placeholder aligning values of items without birthday
+_BIRTHDAY_PLACEHOLDER = " " * len(f"birthday {DATE_FORMAT_STR_REPRESENTATION}")
+
 
 def truncate_string(
     string: str,
@@ -62,9 +70,11 @@ def truncate_string(
             f"but was '{type(suffix).__name__}'"
         )
 
-    # Guard empty values
-    if not string and not suffix:
-        return ""
+    # Without a suffix the string is just cut to max_length
+    if not suffix:
+        if include_suffix_in_text_max_length and max_length <= 0:
+            return ""
+        return string[:max_length]
 
     string_length = len(string)
 
@@ -74,7 +84,7 @@ def truncate_string(
 
     # Case where suffix has no influence on result and just added to the end of the truncated string
     if not include_suffix_in_text_max_length:
-        return f"{string[:max_length]}{suffix}"
+        return string[:max_length] + suffix
 
     # Following is a case when suffix length matters
 
@@ -88,46 +98,67 @@ def truncate_string(
         return suffix[-max_length:]
 
     # There is at least one symbol in the string
-    string_slice_end = max_length - suffix_length
-    sliced_string = string[:string_slice_end]
-    return f"{sliced_string}{suffix}"
+    return string[: max_length - suffix_length] + suffix
+
+
+def get_ngrams(string: str, size: int = SEARCH_NGRAM_LENGTH) -> set[str]:
+    """
+    Returns the set of all substrings of the given length (n-grams) of a string.
+
+    Args:
+        string (str): The input string to split into n-grams.
+        size (int): The length of each n-gram.
 
+    Returns:
+        set[str]: Unique n-grams of the string, empty if the string is shorter than size.
 
-def format_contacts_output(contacts_dict: dict) -> str:
+    Examples:
+        >>> sorted(get_ngrams("alice", size=3))
+        ['ali', 'ice', 'lic']
+    """
+    return {string[idx : idx + size] for idx in range(len(string) - size + 1)}
+
+
+def format_contacts_output(contacts_dict: dict, max_name_len: int | None = None) -> str:
     """
     Formats the contact dictionary into a readable string.
 
     Args:
         contacts_dict (dict): A dictionary of contacts with their details.
+        max_name_len (int, optional): Length of the longest contact name, if already
+                                      known by the caller. Computed when omitted.
 
     Returns:
         str: Formatted string output.
     """
     # Format output header and aligned lines
     count = len(contacts_dict)
-    suffix = "" if count == 1 else "s"
-    header = MSG_HAVE_CONTACTS.format(count, suffix)
+    header = MSG_HAVE_ONE_CONTACT if count == 1 else MSG_HAVE_CONTACTS.format(count)
 
     # Format output aligned lines
-    items = []
-    for name, details in contacts_dict.items():
-        items.append(
-            {
-                "name": name,
-                "phones": details.get("phones", []),
-                "birthday": details.get("birthday"),
-            }
-        )
+    items = [
+        {
+            "name": name,
+            "phones": details.get("phones", []),
+            "birthday": details.get("birthday"),
+        }
+        for name, details in contacts_dict.items()
+    ]
+    if max_name_len is None:
+        max_name_len = max(map(len, contacts_dict), default=0)
 
     # Sort by name (case-insensitive)
-    items = sorted(items, key=lambda item: item["name"].casefold())
+    items.sort(key=lambda item: item["name"].casefold())
 
-    return format_text_output(output_result={"message": header, "items": items})
+    return format_text_output(
+        output_result={"message": header, "items": items}, max_name_len=max_name_len
+    )
 
 
 def format_text_output(
     output_result: dict[str, str | list[dict]],
     lines_offset: str = DEFAULT_LINE_OFFSET,
+    max_name_len: int | None = None,
 ) -> str:
     """
     Format the structured result dictionary into a human-readable text output.
@@ -142,6 +173,8 @@ def format_text_output(
             - "message" (str): The main header or summary message.
             - "items" (list[dict], optional): A list of dictionaries containing item details.
         lines_offset (str, optional): A string prefix for each item line, e.g., indentation.
+        max_name_len (int, optional): Length of the longest item name, if already
+                                      known by the caller. Computed when omitted.
 
     Returns:
         str: A formatted string suitable for display in a CLI interface.
@@ -157,19 +190,22 @@ def format_text_output(
     if not items:
         return message
 
-    lines = [f"{message}:"] if message else []
-    max_name_len = max(len(item.get("name", "")) for item in items)
+    lines = [message + ":"] if message else []
+    if max_name_len is None:
+        max_name_len = max(len(item.get("name", "")) for item in items)
     has_birthday = any(
         item.get("birthday") and item.get("birthday") != "None" for item in items
     )
+    # Names are padded with a slice of a single padding string
+    name_padding = " " * max_name_len
     for item in items:
-        lines.append(__format_item(item, lines_offset, max_name_len, has_birthday))
+        lines.append(__format_item(item, lines_offset, name_padding, has_birthday))
 
     return "\n".join(lines)
 
 
 def __format_item(
-    item: dict, lines_offset: str, max_name_len: int, has_birthday: bool
+    item: dict, lines_offset: str, name_padding: str, has_birthday: bool
 ) -> str:
     # name
     name = item.get("name", "")
@@ -187,15 +223,13 @@ def __format_item(
         birthday = f"birthday {formatted_birthday_date_str}"
         values.append(birthday)
     elif has_birthday:
-        birthday = " ".ljust(len(f"birthday {DATE_FORMAT_STR_REPRESENTATION}"))
-        values.append(birthday)
+        values.append(_BIRTHDAY_PLACEHOLDER)
 
     # phones
     phones_raw = item.get("phones")  # May be: None or "None" str or []
     phones_label = "phones "
     if isinstance(phones_raw, list):
-        joined_phones = f"{LINE_VALUE_LIST_SEPARATION_SYMBOL} ".join(phones_raw)
-        values.append(f"{phones_label}{joined_phones}")
+        values.append(phones_label + _VALUE_LIST_SEPARATOR.join(phones_raw))
     elif phones_raw and phones_raw != "None":
         values.append(phones_label)
 
@@ -217,9 +251,14 @@ def __format_item(
     if congratulation:
         values.append(congratulation)
 
-    return (
-        f"{lines_offset}{name.ljust(max_name_len)} : "
-        f"{(' ' + LINE_VALUE_GROUP_SEPARATION_SYMBOL + ' ').join(values)}"
+    return "".join(
+        (
+            lines_offset,
+            name,
+            name_padding[len(name) :],
+            " : ",
+            _VALUE_GROUP_SEPARATOR.join(values),
+        )
     )
 
 
@@ -358,6 +397,18 @@ if __name__ == "__main__":
         == "34567890"
     )
     assert truncate_string("", suffix="") == ""
+    assert (
+        truncate_string(TEST_TRUNCATE_STRING, max_length=-1, suffix="") == "Hello world"
+    )
+    assert (
+        truncate_string(
+            TEST_TRUNCATE_STRING,
+            max_length=-1,
+            suffix="",
+            include_suffix_in_text_max_length=True,
+        )
+        == ""
+    )
     assert truncate_string("", suffix="", include_suffix_in_text_max_length=True) == ""
 
     try:
@@ -376,6 +427,17 @@ if __name__ == "__main__":
     else:
         assert False, "Should raise TypeError when max_length is not int"
 
+    # N-grams tests
+
+    assert get_ngrams("alice", size=3) == {"ali", "lic", "ice"}
+    assert get_ngrams("aaaa", size=3) == {"aaa"}
+    assert get_ngrams("ab", size=3) == set()
+    assert get_ngrams("") == set()
+    assert get_ngrams("abc", size=2) == {"ab", "bc"}
+    # default n-gram length is the search index one (bigrams)
+    assert get_ngrams("alice") == {"al", "li", "ic", "ce"}
+    assert get_ngrams("a") == set()
+
     # test format_line_output
 
     TEST_FORMAT_TEXT_OUTPUT_1_1_RESULT = format_text_output(
@@ -24,7 +24,8 @@ def ensure_args_have_n_arguments(
     Raises:
         ValidationError: If the number of arguments is incorrect or any are empty.
     """
-    if len(args) != expected or not all(arg.strip() for arg in args):
+    # Empty or whitespace-only arguments are detected without stripping copies
+    if len(args) != expected or "" in args or any(map(str.isspace, args)):
         plural = "s" if expected != 1 else ""
         details_formatted = f" ({details})" if details else ""
         msg = ERR_ARG_COUNT_ERROR.format(
@@ -75,4 +76,15 @@ if __name__ == "__main__":
     else:
         assert False, "Should raise TypeError error when type is not of expected types."
 
+    ensure_args_have_n_arguments(["Alice", "1234567890"], 2)
+    for test_invalid_args in (["Alice"], ["Alice", ""], ["Alice", " \t"], []):
+        try:
+            ensure_args_have_n_arguments(test_invalid_args, 2, "username and a phone")
+        except ValidationError as exc:
+            assert str(exc) == (
+                "You must provide 2 non-empty arguments (username and a phone)."
+            )
+        else:
+            assert False, "Should raise ValidationError for missing or empty arguments."
+
     print("Args Validator tests passed.")
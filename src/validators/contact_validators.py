@@ -15,6 +15,7 @@ from utils.constants import (
     MSG_CONTACT_EXISTS,
     MSG_NO_CONTACTS,
     MSG_CONTACT_NOT_FOUND,
+    MSG_CONTACT_RENAME_IN_BOOK,
     MSG_PHONE_NUMBER_EXISTS,
     MSG_PHONE_NUMBER_NOT_FOUND,
     MSG_BIRTHDAY_DUPLICATE,
@@ -37,33 +38,52 @@ def ensure_contacts_storage_not_empty(contacts: dict) -> None:
         raise ValidationError(MSG_NO_CONTACTS)
 
 
-def ensure_contact_not_in_contacts_storage(username: str, contacts: dict) -> None:
+def ensure_contact_not_in_contacts_storage(
+    username: str, contacts: dict, casefold_index: dict[str, str] | None = None
+) -> None:
     """
     Ensures the contact with the given username does not already exist (case-insensitive).
 
     Args:
         username (str): username key to be checked.
         contacts (dict): Existing contacts dictionary.
+        casefold_index (dict, optional): Mapping of case-folded usernames to contact
+                                         keys, used for a constant-time lookup.
 
     Raises:
         ValidationError: If contact already exists or is in a different case.
     """
+    casefolded_username = username.casefold()
+
+    if casefold_index is not None:
+        contact_name = casefold_index.get(casefolded_username)
+        if contact_name is None:
+            return
+        if contact_name == username:
+            raise ValidationError(f"{MSG_CONTACT_EXISTS.format(username)}.")
+        raise ValidationError(
+            f"{MSG_CONTACT_EXISTS.format(username)}, "
+            f"but under a different name: '{contact_name}'."
+        )
+
     for contact in contacts.values():
+        # Case-insensitive match covers the exact one, which is told apart on a hit
+        if contact.name.casefolded != casefolded_username:
+            continue
+
         contact_name = contact.name.value
-        # Check for exact match
         if contact_name == username:
             raise ValidationError(f"{MSG_CONTACT_EXISTS.format(username)}.")
-
-        # Check for case-insensitive match
-        if contact_name.casefold() == username.casefold():
-            raise ValidationError(
-                f"{MSG_CONTACT_EXISTS.format(username)}, "
-                f"but under a different name: '{contact_name}'."
-            )
+        raise ValidationError(
+            f"{MSG_CONTACT_EXISTS.format(username)}, "
+            f"but under a different name: '{contact_name}'."
+        )
 
 
 def ensure_contact_is_in_contacts_storage(
-    username: str, contacts: dict[str, any]
+    username: str,
+    contacts: dict[str, any],
+    casefold_index: dict[str, str] | None = None,
 ) -> any:
     """
     Ensures a contact with the provided username exists, case-insensitively.
@@ -71,11 +91,28 @@ def ensure_contact_is_in_contacts_storage(
     Args:
         username (str): username to check.
         contacts (dict): Dictionary of contacts.
+        casefold_index (dict, optional): Mapping of case-folded usernames to contact
+                                         keys, used for a constant-time lookup.
 
     Raises:
         ValidationError: If contact doesn't exist or name differs by case.
     """
-    match = next((c for c in contacts if c.casefold() == username.casefold()), None)
+    casefolded_username = username.casefold()
+
+    if casefold_index is not None:
+        match = casefold_index.get(casefolded_username)
+        contact = None
+    else:
+        # Records keep their case-folded name, so no string is folded per key.
+        # The matched record is kept, so it is not looked up again
+        match, contact = next(
+            (
+                (key, record)
+                for key, record in contacts.items()
+                if record.name.casefolded == casefolded_username
+            ),
+            (None, None),
+        )
 
     if not match:
         raise ValidationError(f"{MSG_CONTACT_NOT_FOUND.format(username)}.")
@@ -88,7 +125,22 @@ def ensure_contact_is_in_contacts_storage(
             f"Did you mean '{match}'?"
         )
 
-    return contacts[match]
+    return contacts[match] if contact is None else contact
+
+
+def ensure_contact_name_unchanged(username: str, record) -> None:
+    """
+    Ensures the contact keeps its name, as address books store contacts by name.
+
+    Args:
+        username (str): New username to check.
+        record: Contact record with its current name.
+
+    Raises:
+        ValidationError: If the new username differs from the current one.
+    """
+    if username != record.name.value:
+        raise ValidationError(MSG_CONTACT_RENAME_IN_BOOK.format(record.name, username))
 
 
 def ensure_phone_not_in_contact(phone_number: str, record) -> None:
@@ -99,42 +151,36 @@ def ensure_phone_not_in_contact(phone_number: str, record) -> None:
 
     Args:
         phone_number (str): Phone number to check.
-        record: Contact record containing a list of phone objects.
+        record: Contact record containing phone objects keyed by phone number.
 
     Raises:
         ValidationError: If the phone number already exists in the contact.
     """
-    for phone_obj in record.phones:
-        if phone_obj.value == phone_number:
-            raise ValidationError(
-                MSG_PHONE_NUMBER_EXISTS.format(record.name, phone_number)
-            )
+    if phone_number in record.phones:
+        raise ValidationError(MSG_PHONE_NUMBER_EXISTS.format(record.name, phone_number))
 
 
-def ensure_phone_is_in_contact(phone_number: str, record) -> tuple[int, Phone]:
+def ensure_phone_is_in_contact(phone_number: str, record) -> Phone:
     """
-    Validates that a given phone number exists in the contact and returns its position.
+    Validates that a given phone number exists in the contact and returns its phone.
 
     Args:
         phone_number (str): Phone number to find.
-        record: Contact record containing a list of phone objects.
+        record: Contact record containing phone objects keyed by phone number.
 
     Returns:
-        tuple[int, Phone]: Index and phone object if found.
+        Phone: Phone object if found.
 
     Raises:
         ValidationError: If the phone number is not found.
     """
-    if not record.phones:
+    phone = record.phones.get(phone_number)
+    if phone is None:
         raise ValidationError(
             MSG_PHONE_NUMBER_NOT_FOUND.format(phone_number, record.name)
         )
 
-    for idx, phone in enumerate(record.phones):
-        if phone.value == phone_number:
-            return idx, phone
-
-    raise ValidationError(MSG_PHONE_NUMBER_NOT_FOUND.format(phone_number, record.name))
+    return phone
 
 
 def ensure_birthday_in_contact_not_duplicate(birthday: date, record):
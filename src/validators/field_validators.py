@@ -3,7 +3,6 @@ Validators for field values (name, phone, etc.).
 
 Validators raise ValidationError with descriptive messages if validation fails.
 """
-import re
 from datetime import date as datetime_day
 
 from utils.constants import (
@@ -36,18 +35,34 @@ def validate_username_length(username: str) -> None:
     Raises:
         ValidationError: If username is too short or too long.
     """
-    username = username.strip()
+    validate_stripped_username_length(username.strip())
 
+
+def validate_stripped_username_length(username: str) -> None:
+    """
+    Validates an already stripped username against allowed lengths.
+
+    Args:
+        username (str): name to validate, without surrounding whitespace.
+
+    Raises:
+        ValidationError: If username is too short or too long.
+    """
     if not username:
         raise ValidationError(USERNAME_EMPTY_ERROR)
 
-    if len(username) < NAME_MIN_LENGTH:
+    # Fast path: error messages are only built for names of invalid length
+    username_len = len(username)
+    if NAME_MIN_LENGTH <= username_len <= NAME_MAX_LENGTH:
+        return
+
+    if username_len < NAME_MIN_LENGTH:
         err_msg_too_short = USERNAME_TOO_SHORT_ERROR.format(
             username=username, min_len=NAME_MIN_LENGTH
         )
         raise ValidationError(err_msg_too_short)
 
-    if len(username) > NAME_MAX_LENGTH:
+    if username_len > NAME_MAX_LENGTH:
         truncated_username = truncate_string(
             username,
             max_length=MAX_DISPLAY_NAME_LEN,
@@ -69,15 +84,31 @@ def validate_phone_number(phone: str) -> None:
     Raises:
         ValidationError: If phone number format is invalid.
     """
-    phone = phone.strip()
+    validate_stripped_phone_number(phone.strip())
 
+
+def validate_stripped_phone_number(phone: str) -> None:
+    """
+    Validates an already stripped phone number format.
+
+    Args:
+        phone (str): phone number to validate, without surrounding whitespace.
+
+    Raises:
+        ValidationError: If phone number format is invalid.
+    """
     if not phone:
         raise ValidationError(PHONE_EMPTY_ERROR)
 
-    # Remove all non-digit characters for counting digits, incl. "+" symbol
-    digits_only = re.sub(r"\D", "", phone)
+    # Fast path for the common case: plain digits, optionally prefixed with "+"
+    digits = phone[1:] if phone.startswith("+") else phone
+    if len(digits) == 10 and digits.isascii() and digits.isdigit():
+        return
 
-    if not len(digits_only) == 10:
+    # Numbers shorter than 10 symbols are rejected without scanning. Otherwise
+    # count digits only, ignoring any formatting characters, incl. "+" symbol
+    # (str.isdecimal matches the same characters as the regex "\d")
+    if len(phone) < 10 or sum(map(str.isdecimal, phone)) != 10:
         raise ValidationError(
             PHONE_INVALID_FORMAT_ERROR.format(
                 phone=phone, format_description=PHONE_FORMAT_DESC_STR